@@ -0,0 +1,55 @@
+"""
+Import cost of the lazy packages and of their first attribute access.
+
+Sums the cumulative `python -X importtime` entries of everything a statement imports beyond interpreter startup,
+best of a few runs.
+
+    PYTHONPATH=src python benchmarks/import_time.py [statement ...]
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import flywheel",
+    "from flywheel import FnCollectEndpoint",
+    "import kanade.signature_prototype",
+    "from kanade.signature_prototype import Signature",
+]
+
+
+def run(code: str) -> tuple[list[str], set[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys; {code}; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+    )
+    return proc.stderr.splitlines(), set(proc.stdout.split())
+
+
+def import_time(statement: str) -> int:
+    _, startup = run("pass")
+    lines, _ = run(statement)
+
+    # top-level entries only, their cumulative time covers what they import in turn
+    total = 0
+    for line in lines[1:]:  # below the column header
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  ") and name.strip() not in startup:
+            total += int(cumulative)
+    return total
+
+
+def main(statements: list[str]):
+    for statement in statements:
+        best = min(import_time(statement) for _ in range(5))
+        print(f"{statement:<52} {best / 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or STATEMENTS)
@@ -0,0 +1,68 @@
+"""
+Per-call cost of a `scoped_collect` handler against a plain bound method.
+
+The handler resolves its instance from the current `InstanceContext` on each call: on top of the bound method it
+costs one wrapper frame, a `ContextVar.get` and a mapping lookup, a `ChainMap` one inside an inheriting scope.
+
+    PYTHONPATH=src python benchmarks/scoped_call.py [calls]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from flywheel import CollectContext, FnCollectEndpoint, InstanceContext, SimpleOverload, scoped_collect
+
+NAME = SimpleOverload("name")
+
+
+@FnCollectEndpoint
+def greet(name: str):
+    yield NAME.hold(name)
+    return lambda: None
+
+
+def main(calls: int):
+    context = CollectContext()
+    collector = scoped_collect()
+    collector.fn_implements = context.fn_implements
+
+    class Handler(collector.target):
+        @collector.target.impl(greet("a"))
+        def hello(self):
+            return self
+
+    # the implementation as laid in the endpoint, without going through the harvest
+    handler = Handler.hello.impl
+
+    class Plain:
+        def hello(self):
+            return self
+
+    plain = Plain().hello
+    rows = [("plain bound method", lambda: timeit.timeit(plain, number=calls))]
+
+    def in_scope(inherit: bool):
+        def run():
+            with InstanceContext().scope(inherit=False) as outer:
+                outer.store(Handler())
+                if not inherit:
+                    return timeit.timeit(handler, number=calls)
+                with InstanceContext().scope():
+                    return timeit.timeit(handler, number=calls)
+
+        return run
+
+    rows.append(("handler", in_scope(False)))
+    rows.append(("handler, inheriting scope", in_scope(True)))
+
+    baseline = None
+    for label, run in rows:
+        elapsed = min(run() for _ in range(5))
+        baseline = baseline or elapsed
+        print(f"{label:<28} {elapsed * 1000:8.2f} ms  {elapsed / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,74 @@
+"""
+Memory footprint of holding a large corpus of signatures.
+
+Compares the previous layout (dict-backed frozen dataclass, list of parameters per signature)
+with the slotted `Parameter`/`Signature`, with and without `Signature.intern()`.
+
+    PYTHONPATH=src python benchmarks/signature_memory.py [count]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from kanade.signature_prototype.base import Parameter, Signature
+
+NAMES = ["self", "cls", "x", "y", "key", "value", "default", "name", "timeout", "args", "kwargs", "other", "item", "index"]
+ANNOTATIONS = [None, "int", "str", "Any", "bool | None"]
+KINDS = ["position-only", "positional-or-keyword", "keyword-only"]
+
+
+@dataclass(eq=True, frozen=True)
+class LegacyParameter:
+    name: str
+    annotation: Any = None
+    default: Any = None
+    type: str = "positional-or-keyword"
+
+
+class LegacySignature:
+    def __init__(self, parameters: list):
+        self.parameters = parameters
+
+
+def corpus(count: int, seed: int = 0):
+    rng = random.Random(seed)
+
+    for _ in range(count):
+        size = min(int(rng.expovariate(0.5)), 8)
+        names = rng.sample(NAMES, size)
+        kinds = sorted(rng.choice(KINDS) for _ in names)
+        yield [(name, rng.choice(ANNOTATIONS), None, kind) for name, kind in zip(names, kinds)]
+
+
+def measure(build: Callable[[list[tuple]], Any], specs: list[list[tuple]]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [build(spec) for spec in specs]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del held
+    return after - before
+
+
+def main(count: int = 100_000):
+    specs = list(corpus(count))
+
+    results = {
+        "legacy (dict dataclass, list)": measure(lambda spec: LegacySignature([LegacyParameter(*p) for p in spec]), specs),
+        "slotted": measure(lambda spec: Signature([Parameter(*p) for p in spec]), specs),
+        "slotted + intern()": measure(lambda spec: Signature([Parameter(*p) for p in spec]).intern(), specs),
+    }
+
+    baseline = results["legacy (dict dataclass, list)"]
+    for label, size in results.items():
+        print(f"{label:<32} {size / 2**20:8.2f} MiB  {size / count:8.1f} B/signature  {size / baseline:6.1%}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,86 @@
+"""
+Size and speed of `kanade.analyser.model.codec` against pickle, over a corpus of function types
+sharing a small vocabulary of classes (as a module's exported signatures do).
+
+    PYTHONPATH=src python benchmarks/type_codec.py [count]
+"""
+
+from __future__ import annotations
+
+import pickle
+import random
+import sys
+import time
+from typing import Callable
+
+from kanade.analyser.model.codec import decode, encode
+from kanade.analyser.model.type import (
+    KnAny,
+    KnBaseType,
+    KnCallable,
+    KnInstance,
+    KnLiteral,
+    KnNone,
+    KnParameters,
+    KnUnion,
+)
+from kanade.analyser.signature import TypedParameter
+
+CLASSES = ["int", "str", "bytes", "float", "bool", "list", "dict", "Path", "Node", "Module", "Symbol", "Context"]
+NAMES = ["self", "x", "y", "key", "value", "default", "name", "timeout", "other", "item", "index"]
+KINDS = ["position-only", "positional-or-keyword", "keyword-only"]
+
+
+def corpus(count: int, seed: int = 0) -> list[KnBaseType]:
+    rng = random.Random(seed)
+
+    def type_() -> KnBaseType:
+        roll = rng.random()
+        if roll < 0.1:
+            return KnAny()
+        if roll < 0.2:
+            return KnLiteral(rng.randrange(8))
+        if roll < 0.4:
+            return KnUnion([KnInstance(rng.choice(CLASSES), []), KnNone()])
+        if roll < 0.5:
+            return KnInstance("list", [KnInstance(rng.choice(CLASSES), [])])
+        return KnInstance(rng.choice(CLASSES), [])
+
+    result: list[KnBaseType] = []
+    for _ in range(count):
+        names = rng.sample(NAMES, min(int(rng.expovariate(0.5)), 6))
+        kinds = sorted(rng.choice(KINDS) for _ in names)
+        parameters = [TypedParameter(name, type_(), kind=kind) for name, kind in zip(names, kinds)]  # type: ignore
+        result.append(KnCallable(KnParameters(parameters), type_()))
+    return result
+
+
+def timed(action: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(count: int = 20_000):
+    types = corpus(count)
+
+    pickled = pickle.dumps(types, protocol=pickle.HIGHEST_PROTOCOL)
+    encoded = encode(types)
+    assert list(decode(encoded)) == types
+
+    rows = {
+        "pickle": (len(pickled), timed(lambda: pickle.dumps(types, protocol=pickle.HIGHEST_PROTOCOL)), timed(lambda: pickle.loads(pickled))),
+        "codec": (len(encoded), timed(lambda: encode(types)), timed(lambda: list(decode(encoded)))),
+        "codec, 1% of roots": (len(encoded), 0.0, timed(lambda: decode(encoded)[::100])),
+    }
+
+    baseline = len(pickled)
+    for label, (size, dump, load) in rows.items():
+        print(f"{label:<20} {size / 1024:9.1f} KiB {size / baseline:7.1%}   encode {dump * 1e3:8.2f} ms   decode {load * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
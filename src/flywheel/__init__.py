@@ -1,14 +1,41 @@
-from .context import CollectContext as CollectContext
-from .context import InstanceContext as InstanceContext
-from .fn import FnCollectEndpoint as FnCollectEndpoint
-from .fn import FnImplementEntity as FnImplementEntity
-from .fn import FnOverload as FnOverload
-from .fn import FnRecord as FnRecord
-from .globals import global_collect as global_collect
-from .globals import local_collect as local_collect
-from .instance_of import InstanceOf as InstanceOf
-from .overloads import SINGLETON_OVERLOAD as SINGLETON_OVERLOAD
-from .overloads import SimpleOverload as SimpleOverload
-from .overloads import SingletonOverload as SingletonOverload
-from .overloads import TypeOverload as TypeOverload
-from .scoped import scoped_collect as scoped_collect
+TYPE_CHECKING = False  # avoid importing `typing` just for this flag; type checkers treat it as `typing.TYPE_CHECKING`
+
+if TYPE_CHECKING:
+    from .context import CollectContext as CollectContext
+    from .context import InstanceContext as InstanceContext
+    from .fn import FnCollectEndpoint as FnCollectEndpoint
+    from .fn import FnImplementEntity as FnImplementEntity
+    from .fn import FnOverload as FnOverload
+    from .fn import FnRecord as FnRecord
+    from .globals import global_collect as global_collect
+    from .globals import local_collect as local_collect
+    from .instance_of import InstanceOf as InstanceOf
+    from .overloads import SINGLETON_OVERLOAD as SINGLETON_OVERLOAD
+    from .overloads import SimpleOverload as SimpleOverload
+    from .overloads import SingletonOverload as SingletonOverload
+    from .overloads import TypeOverload as TypeOverload
+    from .scoped import scoped_collect as scoped_collect
+
+_EXPORTS = {
+    "CollectContext": ".context",
+    "InstanceContext": ".context",
+    "FnCollectEndpoint": ".fn",
+    "FnImplementEntity": ".fn",
+    "FnOverload": ".fn",
+    "FnRecord": ".fn",
+    "global_collect": ".globals",
+    "local_collect": ".globals",
+    "InstanceOf": ".instance_of",
+    "SINGLETON_OVERLOAD": ".overloads",
+    "SimpleOverload": ".overloads",
+    "SingletonOverload": ".overloads",
+    "TypeOverload": ".overloads",
+    "scoped_collect": ".scoped",
+}
+
+__all__ = list(_EXPORTS)
+
+
+from ._lazy import lazy_exports  # noqa: E402
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import sys
+
+
+def lazy_exports(module_name: str, exports: dict[str, str]):
+    """
+    Module-level `__getattr__` and `__dir__` importing each name of `exports` (name -> relative module) on first access,
+    so importing the package itself stays cheap.
+    """
+
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        from importlib import import_module
+
+        # set on the module object: in `flywheel`, `globals` is shadowed by the `flywheel.globals` submodule once loaded.
+        value = getattr(import_module(exports[name], module_name), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted({*vars(sys.modules[module_name]), *exports})
+
+    return __getattr__, __dir__
@@ -4,21 +4,39 @@ from collections import ChainMap
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Mapping, MutableMapping
 
-from .typing import TEntity
-
 if TYPE_CHECKING:
+    from .fn.endpoint import CollectEndpointTarget
+    from .fn.implement import FnImplementEntity
     from .fn.record import FnImplement, FnRecord
+    from .typing import TEntity
 
 
 class CollectContext:
     fn_implements: dict[FnImplement, FnRecord]
+    pending: dict[FnImplement, list[tuple[FnImplementEntity, CollectEndpointTarget]]]
+    lazy: bool
+    generation: int = 0
 
-    def __init__(self):
+    def __init__(self, *, lazy: bool = False):
         self.fn_implements = {}
+        self.pending = {}
+        self.lazy = lazy
 
     def collect(self, entity: TEntity) -> TEntity:
         return entity.collect(self)
 
+    def discard(self, entity: TEntity) -> TEntity:
+        return entity.uncollect(self)
+
+    def drain(self, signature: FnImplement):
+        if signature not in self.pending:
+            return
+
+        for entity, generator in self.pending.pop(signature):
+            entity.lay_target(self, signature, generator)
+
+        self.generation += 1
+
     @contextmanager
     def collect_scope(self):
         from .globals import COLLECTING_CONTEXT_VAR
@@ -25,6 +25,12 @@ class BaseEntity:
 
         return self
 
+    def uncollect(self, collector: CollectContext | None = None):
+        if collector is None or collector is self.collect_context:
+            self.collect_context = None
+
+        return self
+
     def assign_callback(self, info: EntityAssignInfo): ...
 
     @final
@@ -1,6 +1,25 @@
-from .endpoint import FnCollectEndpoint as FnCollectEndpoint
-from .harvest import FnHarvest as FnHarvest
-from .harvest import FnHarvestControl as FnHarvestControl
-from .implement import FnImplementEntity as FnImplementEntity
-from .overload import FnOverload as FnOverload
-from .record import FnRecord as FnRecord
+TYPE_CHECKING = False  # avoid importing `typing` just for this flag; type checkers treat it as `typing.TYPE_CHECKING`
+
+if TYPE_CHECKING:
+    from .endpoint import FnCollectEndpoint as FnCollectEndpoint
+    from .harvest import FnHarvest as FnHarvest
+    from .harvest import FnHarvestControl as FnHarvestControl
+    from .implement import FnImplementEntity as FnImplementEntity
+    from .overload import FnOverload as FnOverload
+    from .record import FnRecord as FnRecord
+
+_EXPORTS = {
+    "FnCollectEndpoint": ".endpoint",
+    "FnHarvest": ".harvest",
+    "FnHarvestControl": ".harvest",
+    "FnImplementEntity": ".implement",
+    "FnOverload": ".overload",
+    "FnRecord": ".record",
+}
+
+__all__ = list(_EXPORTS)
+
+
+from .._lazy import lazy_exports  # noqa: E402
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
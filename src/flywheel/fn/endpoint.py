@@ -63,6 +63,7 @@ class FnCollectEndpointAgent(Generic[P, CnQ, A, B]):
         sig = self.endpoint.signature
 
         for i in iter_layout(self.endpoint):
+            i.drain(sig)
             if sig in i.fn_implements:
                 record = i.fn_implements[sig]
                 break
@@ -115,6 +116,7 @@ class FnCollectEndpoint(Generic[P, CnQ]):
         sig = self.signature
 
         for i in iter_layout(self):
+            i.drain(sig)
             if sig in i.fn_implements:
                 record = i.fn_implements[sig]
                 break
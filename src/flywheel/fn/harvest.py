@@ -1,15 +1,29 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, Iterator
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterator
 
 from ..typing import C
 from .overload import FnOverload, TCallValue
+from .record import merge
 
 if TYPE_CHECKING:
+    import asyncio
+
     from .endpoint import FnCollectEndpoint
     from .record import FnRecord
 
 
+async def _invoke(implement: Callable, args: tuple, kwargs: dict[str, Any], semaphore: asyncio.Semaphore | None):
+    from contextlib import nullcontext
+    from inspect import isawaitable
+
+    async with semaphore or nullcontext():
+        result = implement(*args, **kwargs)
+        if isawaitable(result):
+            result = await result
+        return result
+
+
 class FnHarvestControl(Generic[C]):
     def __init__(self, endpoint: FnCollectEndpoint, record: FnRecord) -> None:
         self.endpoint = endpoint
@@ -22,40 +36,104 @@ class FnHarvestControl(Generic[C]):
 
 
 class FnHarvest(Generic[C]):
+    candidates: list[dict[Callable, int]] | None
+
     def __init__(self, control: FnHarvestControl[C]) -> None:
         self.control = control
-        self.result = None
+        self.candidates = None
 
     def apply(self, overload: FnOverload[Any, Any, TCallValue], value: TCallValue):
-        self.result = overload.dig(self.control.record, value)
+        self.candidates = [overload.dig(self.control.record, value)]
         return self
 
     def inter(self, overload: FnOverload[Any, Any, TCallValue], value: TCallValue):
-        if self.result is None:
+        if self.candidates is None:
             raise NotImplementedError(f"result is None, cannot use overload {overload} with value {value}")
 
-        self.result = dict(self.result.items() & overload.dig(self.control.record, value).items())
+        # intersections are deferred; `probe` walks the smallest candidate set and checks the others by membership.
+        self.candidates.append(overload.dig(self.control.record, value))
         return self
 
     def union(self, overload: FnOverload[Any, Any, TCallValue], value: TCallValue):
-        if self.result is None:
+        if self.candidates is None:
             raise NotImplementedError(f"result is None, cannot union overload {overload} with value {value}")
 
-        self.result.update(overload.dig(self.control.record, value))
+        self.candidates = [merge(self.result, overload.dig(self.control.record, value))]  # type: ignore
         return self
 
+    def probe(self) -> Iterator[C]:
+        if self.candidates is None:
+            raise NotImplementedError("result is None, cannot probe")
+
+        if len(self.candidates) == 1:
+            yield from reversed(self.candidates[0])  # type: ignore
+            return
+
+        smallest, *others = sorted(self.candidates, key=len)
+        if not smallest:
+            return
+
+        for implement in reversed(smallest):
+            if all(implement in other for other in others):
+                yield implement  # type: ignore
+
+    @property
+    def result(self) -> dict[Callable, int] | None:
+        if self.candidates is None:
+            return None
+
+        if len(self.candidates) > 1:
+            smallest, *others = sorted(self.candidates, key=len)
+            self.candidates = [{k: v for k, v in smallest.items() if all(k in other for other in others)}]
+
+        return self.candidates[0]
+
     @property
     def first(self) -> C:
-        if self.result is None:
+        if self.candidates is None:
             raise NotImplementedError("result is None, cannot get first item")
 
-        return next(reversed(self.result))  # type: ignore
+        return next(self.probe())
 
     def __iter__(self) -> Iterator[C]:
-        if self.result is None:
+        if self.candidates is None:
             raise NotImplementedError("result is None, cannot iterate")
 
-        return reversed(self.result)  # type: ignore
+        return self.probe()
 
     def __bool__(self):
-        return bool(self.result)
+        if self.candidates is None:
+            return False
+
+        return next(self.probe(), None) is not None
+
+    async def gather(
+        self, args: tuple = (), kwargs: dict[str, Any] | None = None, *, limit: int | None = None, timeout: float | None = None
+    ) -> list[Any]:
+        import asyncio
+
+        semaphore = asyncio.Semaphore(limit) if limit is not None else None
+        tasks = [asyncio.ensure_future(_invoke(implement, args, kwargs or {}, semaphore)) for implement in self]
+
+        try:
+            return await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def race(
+        self, args: tuple = (), kwargs: dict[str, Any] | None = None, *, limit: int | None = None, timeout: float | None = None
+    ) -> Any:
+        import asyncio
+
+        semaphore = asyncio.Semaphore(limit) if limit is not None else None
+        tasks = [asyncio.ensure_future(_invoke(implement, args, kwargs or {}, semaphore)) for implement in self]
+
+        try:
+            for future in asyncio.as_completed(tasks, timeout=timeout):
+                result = await future
+                if result is not None:
+                    return result
+        finally:
+            for task in tasks:
+                task.cancel()
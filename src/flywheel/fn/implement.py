@@ -9,15 +9,21 @@ from .record import FnRecord
 
 if TYPE_CHECKING:
     from .endpoint import CollectEndpointTarget, FnCollectEndpoint
+    from .overload import FnOverload
+    from .record import FnImplement
 
 
 class FnImplementEntity(Generic[CR], BaseEntity):
     targets: list[tuple[FnCollectEndpoint, CollectEndpointTarget]]
     impl: CR
+    priority: int
+    layouts: dict[CollectContext, list[tuple[FnImplement, FnRecord, FnOverload, Any]]]
 
-    def __init__(self, impl: CR):
+    def __init__(self, impl: CR, *, priority: int = 0):
         self.targets = []
         self.impl = impl
+        self.priority = priority
+        self.layouts = {}
 
     def add_target(self, endpoint: FnCollectEndpoint[P, Any], generator: CollectEndpointTarget):
         self.targets.append((endpoint, generator))
@@ -25,19 +31,51 @@ class FnImplementEntity(Generic[CR], BaseEntity):
     def collect(self, collector: CollectContext):
         super().collect(collector)
 
-        for endpoint, generator in self.targets:
-            record_signature = endpoint.signature
+        self.layouts.setdefault(collector, [])
+
+        if collector.lazy:
+            for endpoint, generator in self.targets:
+                collector.pending.setdefault(endpoint.signature, []).append((self, generator))
 
-            if record_signature in collector.fn_implements:
-                record = collector.fn_implements[record_signature]
-            else:
-                record = collector.fn_implements[record_signature] = FnRecord()
+            return self
 
-            for signal in generator:
-                signal.overload.lay(record, signal.value, self.impl)
+        for endpoint, generator in self.targets:
+            self.lay_target(collector, endpoint.signature, generator)
 
+        collector.generation += 1
         return self
 
+    def lay_target(self, collector: CollectContext, record_signature: FnImplement, generator: CollectEndpointTarget):
+        layout = self.layouts.setdefault(collector, [])
+
+        if record_signature in collector.fn_implements:
+            record = collector.fn_implements[record_signature]
+        else:
+            record = collector.fn_implements[record_signature] = FnRecord()
+
+        for signal in generator:
+            signature = signal.overload.lay(record, signal.value, self.impl, priority=self.priority)
+            layout.append((record_signature, record, signal.overload, signature))
+
+    def uncollect(self, collector: CollectContext | None = None):
+        collector = collector or self.collect_context
+        if collector is None or collector not in self.layouts:
+            return self
+
+        for endpoint, _ in self.targets:
+            queue = collector.pending.get(endpoint.signature)
+            if queue:
+                queue[:] = [item for item in queue if item[0] is not self]
+
+        for record_signature, record, overload, signature in self.layouts.pop(collector):
+            overload.unlay(record, signature, self.impl)
+
+            if not record.scopes and collector.fn_implements.get(record_signature) is record:
+                del collector.fn_implements[record_signature]
+
+        collector.generation += 1
+        return super().uncollect(collector)
+
     def _call(self, *args, **kwargs):
         return self.impl(*args, **kwargs)
 
@@ -4,7 +4,7 @@ from typing import Callable, Generic, TypeVar
 
 from typing_extensions import final
 
-from .record import FnOverloadSignal, FnRecord
+from .record import FnOverloadSignal, FnRecord, place
 
 TOverload = TypeVar("TOverload", bound="FnOverload", covariant=True)
 TCallValue = TypeVar("TCallValue")
@@ -21,7 +21,7 @@ class FnOverload(Generic[TSignature, TCollectValue, TCallValue]):
         return FnOverloadSignal(self, value)
 
     @final
-    def dig(self, record: FnRecord, call_value: TCallValue, *, name: str | None = None) -> dict[Callable, None]:
+    def dig(self, record: FnRecord, call_value: TCallValue, *, name: str | None = None) -> dict[Callable, int]:
         name = name or self.name
         if name not in record.scopes:
             raise NotImplementedError("cannot lookup any implementation with given arguments")
@@ -29,22 +29,47 @@ class FnOverload(Generic[TSignature, TCollectValue, TCallValue]):
         return self.harvest(record.scopes[name], call_value)
 
     @final
-    def lay(self, record: FnRecord, collect_value: TCollectValue, implement: Callable, *, name: str | None = None):
+    def lay(self, record: FnRecord, collect_value: TCollectValue, implement: Callable, *, name: str | None = None, priority: int = 0):
         name = name or self.name
         if name not in record.scopes:
             record.scopes[name] = {}
 
-        collection = self.collect(record.scopes[name], self.digest(collect_value))
-        collection[implement] = None
+        signature = self.digest(collect_value)
+        collection = self.collect(record.scopes[name], signature)
+        place(collection, implement, priority)
+        return signature
+
+    @final
+    def unlay(self, record: FnRecord, signature: TSignature, implement: Callable, *, name: str | None = None):
+        name = name or self.name
+        if name not in record.scopes:
+            return
+
+        scope = record.scopes[name]
+        collection = self.access(scope, signature)
+        if collection is None:
+            return
+
+        collection.pop(implement, None)
+        if not collection:
+            self.prune(scope, signature)
+
+        if not scope:
+            del record.scopes[name]
 
     def digest(self, collect_value: TCollectValue) -> TSignature:
         raise NotImplementedError
 
-    def collect(self, scope: dict, signature: TSignature) -> dict[Callable, None]:
+    def collect(self, scope: dict, signature: TSignature) -> dict[Callable, int]:
         raise NotImplementedError
 
-    def harvest(self, scope: dict, call_value: TCallValue) -> dict[Callable, None]:
+    def harvest(self, scope: dict, call_value: TCallValue) -> dict[Callable, int]:
         raise NotImplementedError
 
-    def access(self, scope: dict, signature: TSignature) -> dict[Callable, None] | None:
+    def access(self, scope: dict, signature: TSignature) -> dict[Callable, int] | None:
         raise NotImplementedError
+
+    def prune(self, scope: dict, signature: TSignature) -> None:
+        # removes the emptied collection of `signature` from `scope`; overloads that do not override it
+        # keep the empty collection, which harvests as nothing.
+        pass
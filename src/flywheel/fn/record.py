@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from heapq import merge as _merge
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
@@ -9,6 +11,8 @@ if TYPE_CHECKING:
 
 
 # layout: FnImplement -> {FnCollectEndpoint -> FnRecord}
+# collection: {implement -> priority}, kept ascending by priority (stable for ties),
+#             so `reversed(collection)` yields highest priority first, latest registration first among ties.
 
 
 @dataclass(eq=True, frozen=True)
@@ -26,3 +30,25 @@ class FnRecord:
 class FnOverloadSignal:
     overload: FnOverload
     value: Any
+
+
+def place(collection: dict[Callable, int], implement: Callable, priority: int = 0):
+    collection.pop(implement, None)
+
+    tail = []
+    for existing, existing_priority in reversed(collection.items()):
+        if existing_priority <= priority:
+            break
+        tail.append((existing, existing_priority))
+
+    for existing, _ in tail:
+        del collection[existing]
+
+    collection[implement] = priority
+
+    for existing, existing_priority in reversed(tail):
+        collection[existing] = existing_priority
+
+
+def merge(left: dict[Callable, int], right: dict[Callable, int]) -> dict[Callable, int]:
+    return dict(_merge(left.items(), right.items(), key=itemgetter(1)))
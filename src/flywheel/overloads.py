@@ -15,7 +15,7 @@ class SimpleOverload(FnOverload[SimpleOverloadSignature, Any, Any]):
     def digest(self, collect_value: Any) -> SimpleOverloadSignature:
         return SimpleOverloadSignature(collect_value)
 
-    def collect(self, scope: dict, signature: SimpleOverloadSignature) -> dict[Callable, None]:
+    def collect(self, scope: dict, signature: SimpleOverloadSignature) -> dict[Callable, int]:
         if signature.value not in scope:
             target = scope[signature.value] = {}
         else:
@@ -23,16 +23,19 @@ class SimpleOverload(FnOverload[SimpleOverloadSignature, Any, Any]):
 
         return target
 
-    def harvest(self, scope: dict, call_value: Any) -> dict[Callable, None]:
+    def harvest(self, scope: dict, call_value: Any) -> dict[Callable, int]:
         if call_value in scope:
             return scope[call_value]
 
         return {}
 
-    def access(self, scope: dict, signature: SimpleOverloadSignature) -> dict[Callable, None] | None:
+    def access(self, scope: dict, signature: SimpleOverloadSignature) -> dict[Callable, int] | None:
         if signature.value in scope:
             return scope[signature.value]
 
+    def prune(self, scope: dict, signature: SimpleOverloadSignature) -> None:
+        scope.pop(signature.value, None)
+
 
 @dataclass(eq=True, frozen=True)
 class TypeOverloadSignature:
@@ -43,7 +46,7 @@ class TypeOverload(FnOverload[TypeOverloadSignature, Type[Any], Any]):
     def digest(self, collect_value: type) -> TypeOverloadSignature:
         return TypeOverloadSignature(collect_value)
 
-    def collect(self, scope: dict, signature: TypeOverloadSignature) -> dict[Callable, None]:
+    def collect(self, scope: dict, signature: TypeOverloadSignature) -> dict[Callable, int]:
         if signature.type not in scope:
             target = scope[signature.type] = {}
         else:
@@ -51,17 +54,20 @@ class TypeOverload(FnOverload[TypeOverloadSignature, Type[Any], Any]):
 
         return target
 
-    def harvest(self, scope: dict, call_value: Any) -> dict[Callable, None]:
+    def harvest(self, scope: dict, call_value: Any) -> dict[Callable, int]:
         t = type(call_value)
         if t in scope:
             return scope[t]
 
         return {}
 
-    def access(self, scope: dict, signature: TypeOverloadSignature) -> dict[Callable, None] | None:
+    def access(self, scope: dict, signature: TypeOverloadSignature) -> dict[Callable, int] | None:
         if signature.type in scope:
             return scope[signature.type]
 
+    def prune(self, scope: dict, signature: TypeOverloadSignature) -> None:
+        scope.pop(signature.type, None)
+
 
 class _SingletonOverloadSignature: ...
 
@@ -75,16 +81,19 @@ class SingletonOverload(FnOverload[_SingletonOverloadSignature, None, None]):
     def digest(self, collect_value) -> _SingletonOverloadSignature:
         return SINGLETON_SIGN
 
-    def collect(self, scope: dict, signature) -> dict[Callable, None]:
+    def collect(self, scope: dict, signature) -> dict[Callable, int]:
         s = scope[None] = {}
         return s
 
-    def harvest(self, scope: dict, call_value) -> dict[Callable, None]:
+    def harvest(self, scope: dict, call_value) -> dict[Callable, int]:
         return scope[None]
 
-    def access(self, scope: dict, signature) -> dict[Callable, None] | None:
+    def access(self, scope: dict, signature) -> dict[Callable, int] | None:
         if None in scope:
             return scope[None]
 
+    def prune(self, scope: dict, signature) -> None:
+        scope.pop(None, None)
+
 
 SINGLETON_OVERLOAD = SingletonOverload("singleton")
@@ -24,7 +24,7 @@ class scoped_collect(CollectContext):
     cls: type | None = None
 
     def __init__(self) -> None:
-        self.fn_implements = {}
+        super().__init__()
         self.finalize_cbs = []
         self._tocollect_list = {}
 
@@ -55,7 +55,7 @@ class scoped_collect(CollectContext):
         self.finalize_cbs.remove(func)
         return func
 
-    @property
+    @functools.cached_property
     def target(self):
         from .fn.implement import FnImplementEntity
 
@@ -71,7 +71,7 @@ class scoped_collect(CollectContext):
                 self.finalize()
 
                 if static:
-                    GLOBAL_INSTANCE_CONTEXT.instances[cls] = cls.build_static()
+                    GLOBAL_INSTANCE_CONTEXT.store({cls: cls.build_static()})
 
             @staticmethod
             def collect(entity: TEntity) -> TEntity:  # type: ignore
@@ -83,6 +83,7 @@ class scoped_collect(CollectContext):
                 def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
                     assert self.cls is not None
 
+                    # resolved on every call: no per-context state to go stale, and no bound method to build
                     instance = INSTANCE_CONTEXT_VAR.get().instances[self.cls]
                     return func(instance, *args, **kwargs)
 
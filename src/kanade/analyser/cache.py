@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, TypeVar
+
+from kanade.analyser.incremental import fingerprint
+
+_V = TypeVar("_V")
+
+# (artefact kind, module name)
+ArtefactKey = tuple[str, str]
+
+_MISSING = object()
+
+
+@dataclass
+class ArtefactKind(Generic[_V]):
+    compute: Callable[[str], _V]  # module name -> artefact
+    size: Callable[[_V], int] = sys.getsizeof  # estimated resident bytes
+    cost: Callable[[_V], float] | None = None  # estimated cost of getting it back, the measured compute time by default
+    # serialisation for the spill area, artefacts without it (e.g. tree-sitter trees) are recomputed instead
+    dump: Callable[[_V], bytes] | None = None
+    load: Callable[[bytes], _V] | None = None
+
+
+@dataclass
+class CacheMetrics:
+    resident: int = 0  # estimated bytes of the artefacts held in memory
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    spills: int = 0
+    reloads: int = 0
+    recomputes: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    cost: float
+    priority: float = 0.0
+    stamp: int = -1  # tie breaker of its live heap item
+
+
+class ArtefactCache:
+    """
+    Per-module artefacts (trees, wrappers, symbol tables...) kept under a memory budget.
+
+    Eviction is cost-aware (GreedyDual-Size): an entry is worth `cost / size` plus the worth of the last evicted entry at
+    the time it was used, the least worth is evicted first. With equal costs and sizes this is LRU; big artefacts
+    that are cheap to recompute go before small expensive ones. Evicted artefacts with a `dump` are written to the
+    spill area and loaded back on their next access, the others are recomputed. The spill area is a fresh directory
+    created under `spill` for each cache, so nothing spilled by an earlier cache is ever loaded; `close` removes it.
+    """
+
+    budget: int
+    spill: Path | None
+    kinds: dict[str, ArtefactKind]
+    entries: dict[ArtefactKey, _Entry]
+    metrics: CacheMetrics
+
+    def __init__(self, budget: int, spill: str | os.PathLike[str] | None = None):
+        self.budget = budget
+        self.spill = None
+        if spill is not None:
+            Path(spill).mkdir(parents=True, exist_ok=True)
+            self.spill = Path(tempfile.mkdtemp(prefix="artefacts-", dir=spill))
+        self.kinds = {}
+        self.entries = {}
+        self.metrics = CacheMetrics()
+
+        # (priority, stamp, key), items whose entry was touched since are skipped when popped
+        self._heap: list[tuple[float, int, ArtefactKey]] = []
+        self._counter = itertools.count()
+        self._inflation = 0.0
+
+    def register(
+        self,
+        kind: str,
+        compute: Callable[[str], _V],
+        *,
+        size: Callable[[_V], int] = sys.getsizeof,
+        cost: Callable[[_V], float] | None = None,
+        dump: Callable[[_V], bytes] | None = None,
+        load: Callable[[bytes], _V] | None = None,
+    ) -> ArtefactKind[_V]:
+        result = self.kinds[kind] = ArtefactKind(compute, size, cost, dump, load)
+        return result
+
+    def get(self, kind: str, module: str) -> Any:
+        key = (kind, module)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.metrics.hits += 1
+            self._touch(key, entry)
+            return entry.value
+
+        self.metrics.misses += 1
+        spec = self.kinds[kind]
+
+        start = time.perf_counter()
+        value = self._reload(key, spec)
+        if value is _MISSING:
+            value = spec.compute(module)
+            self.metrics.recomputes += 1
+        elapsed = time.perf_counter() - start
+
+        entry = self.entries[key] = _Entry(value, spec.size(value), spec.cost(value) if spec.cost is not None else elapsed)
+        self.metrics.resident += entry.size
+        self._touch(key, entry)
+        self._shrink(key)
+        return value
+
+    def invalidate(self, module: str, kind: str | None = None):
+        """
+        Drop the artefacts of `module` (only those of `kind` if given), from memory and from the spill area.
+        """
+
+        for key in [(i, module) for i in self.kinds] if kind is None else [(kind, module)]:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.metrics.resident -= entry.size
+
+            path = self._spill_path(key)
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+    def close(self):
+        """
+        Remove the spill area, the artefacts held in memory stay usable.
+        """
+
+        if self.spill is not None:
+            shutil.rmtree(self.spill, ignore_errors=True)
+            self.spill = None
+
+    def _touch(self, key: ArtefactKey, entry: _Entry):
+        entry.priority = self._inflation + entry.cost / max(entry.size, 1)
+        entry.stamp = next(self._counter)
+        heapq.heappush(self._heap, (entry.priority, entry.stamp, key))
+
+        if len(self._heap) > 4 * len(self.entries) + 64:
+            self._heap = [(i.priority, i.stamp, k) for k, i in self.entries.items()]
+            heapq.heapify(self._heap)
+
+    def _shrink(self, keep: ArtefactKey):
+        # `keep` was just requested and is never evicted here, even alone over the budget
+        kept = []
+        while self.metrics.resident > self.budget and self._heap:
+            item = heapq.heappop(self._heap)
+            priority, stamp, key = item
+            entry = self.entries.get(key)
+            if entry is None or entry.stamp != stamp:
+                continue
+            if key == keep:
+                kept.append(item)
+                continue
+
+            self._inflation = priority
+            self._evict(key, entry)
+
+        for item in kept:
+            heapq.heappush(self._heap, item)
+
+    def _evict(self, key: ArtefactKey, entry: _Entry):
+        del self.entries[key]
+        self.metrics.resident -= entry.size
+        self.metrics.evictions += 1
+
+        spec = self.kinds[key[0]]
+        path = self._spill_path(key)
+        if path is not None and spec.dump is not None:
+            path.write_bytes(spec.dump(entry.value))
+            self.metrics.spills += 1
+
+    def _reload(self, key: ArtefactKey, spec: ArtefactKind) -> Any:
+        path = self._spill_path(key)
+        if path is None or spec.load is None or not path.exists():
+            return _MISSING
+
+        value = spec.load(path.read_bytes())
+        self.metrics.reloads += 1
+        return value
+
+    def _spill_path(self, key: ArtefactKey) -> Path | None:
+        return self.spill / f"{fingerprint(*key)}.bin" if self.spill is not None else None
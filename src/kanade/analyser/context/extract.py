@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Collection, Iterator
+
+from kanade.analyser.context.symbol_table import SymbolBinding, SymbolTable, SymbolTableFrame
+from kanade.language.python import PyStatement, function_parameters, node_text
+
+if TYPE_CHECKING:
+    from tree_sitter import Node
+
+    from kanade.language.python import PyModule
+
+# statements whose children may bind names in the enclosing scope
+CONTAINER_NODES = frozenset(
+    {
+        "module",
+        "block",
+        "decorated_definition",
+        "if_statement",
+        "elif_clause",
+        "else_clause",
+        "while_statement",
+        "for_statement",
+        "try_statement",
+        "except_clause",
+        "except_group_clause",
+        "finally_clause",
+        "with_statement",
+        "with_clause",
+        "with_item",
+        "match_statement",
+        "case_clause",
+    }
+)
+# nodes that are walked through when looking for assignment targets
+TARGET_NODES = frozenset(
+    {
+        "pattern_list",
+        "tuple_pattern",
+        "list_pattern",
+        "tuple",
+        "list",
+        "list_splat_pattern",
+        "parenthesized_expression",
+        "as_pattern_target",
+        "type",
+    }
+)
+# nodes that are walked through when looking for the captures of a `case` pattern
+PATTERN_NODES = frozenset(
+    {
+        "case_pattern",
+        "list_pattern",
+        "tuple_pattern",
+        "dict_pattern",
+        "union_pattern",
+        "class_pattern",
+        "keyword_pattern",
+        "as_pattern",
+        "splat_pattern",
+    }
+)
+
+
+def target_names(node: Node) -> Iterator[str]:
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.type == "identifier":
+            yield node_text(node)
+        elif node.type in TARGET_NODES:
+            stack.extend(reversed(node.named_children))
+
+
+def pattern_names(node: Node) -> Iterator[str]:
+    """
+    Names captured by a `case` pattern: bare names (`case x`, `case [x, *y]`, `case {**z}`) and `as` aliases.
+    Dotted names are value patterns and `_` captures nothing.
+    """
+
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        kind = node.type
+
+        if kind == "dotted_name":
+            if node.named_child_count == 1:
+                yield node_text(node)
+        elif kind == "identifier":
+            # `*rest`, `**rest` and `as alias`, the wildcard is parsed as identifier in `*_`
+            if node.parent is not None and node.parent.type in {"splat_pattern", "as_pattern"} and node_text(node) != "_":
+                yield node_text(node)
+        elif kind in PATTERN_NODES:
+            children = node.named_children
+            if kind == "class_pattern":
+                # the class name is not a capture
+                children = children[1:]
+            elif kind == "keyword_pattern":
+                # nor the keyword
+                children = children[1:]
+            elif kind == "dict_pattern":
+                # keys are literals or value patterns
+                children = [i for i in children if i.type in {"case_pattern", "splat_pattern"}]
+            stack.extend(reversed(children))
+
+
+def statement_bindings(node: Node) -> Iterator[tuple[str, Node]]:
+    kind = node.type
+
+    if kind == "expression_statement":
+        for child in node.named_children:
+            while child is not None and child.type in {"assignment", "augmented_assignment"}:
+                for name in target_names(child.child_by_field_name("left")):  # type: ignore
+                    yield name, node
+                child = child.child_by_field_name("right")
+
+    elif kind == "import_statement":
+        for child in node.children_by_field_name("name"):
+            if child.type == "aliased_import":
+                yield node_text(child.child_by_field_name("alias")), node  # type: ignore
+            else:
+                yield node_text(child.named_children[0]), node
+
+    elif kind == "import_from_statement":
+        for child in node.children_by_field_name("name"):
+            if child.type == "aliased_import":
+                yield node_text(child.child_by_field_name("alias")), node  # type: ignore
+            else:
+                yield node_text(child.named_children[-1]), node
+
+    elif kind in {"for_statement", "type_alias_statement"}:
+        for name in target_names(node.child_by_field_name("left")):  # type: ignore
+            yield name, node
+
+    elif kind == "case_clause":
+        for child in node.named_children:
+            if child.type == "case_pattern":
+                for name in pattern_names(child):
+                    yield name, node
+
+    elif kind == "as_pattern":
+        alias = node.child_by_field_name("alias")
+        if alias is not None:
+            for name in target_names(alias):
+                yield name, node
+
+
+def iter_symbols(module: PyModule, table: SymbolTable | None = None) -> Iterator[tuple[SymbolTable, SymbolBinding]]:
+    """
+    Walk a module with a single tree cursor, pushing a frame for the module and for every class / function it meets,
+    and yield each binding right after it is stored into its frame. Only statement-level bindings are considered,
+    expressions (lambdas, comprehensions, walrus) are not entered.
+    """
+
+    if table is None:
+        table = SymbolTable()
+    table.push_frame(SymbolTableFrame(kind="module", owner=module))
+
+    cursor = module.ast_tree.walk()
+    # (depth of the node that opened the scope, table of the scope)
+    scopes: list[tuple[int, SymbolTable]] = [(-1, table)]
+    depth = 0
+
+    while True:
+        node = cursor.node
+        assert node is not None
+
+        current = scopes[-1][1]
+        kind = node.type
+        opened: SymbolTable | None = None
+        descend = kind in CONTAINER_NODES
+
+        if kind in {"function_definition", "class_definition"}:
+            item = PyStatement(node)
+            opened = current.new_table()
+            opened.push_frame(SymbolTableFrame(kind="function" if kind == "function_definition" else "class", owner=item))
+
+            binding = SymbolBinding(node_text(node.child_by_field_name("name")), item, opened)  # type: ignore
+            current.frames[-1].symbols[binding.name] = binding
+            yield current, binding
+
+            if kind == "function_definition":
+                for param in function_parameters(node):
+                    binding = SymbolBinding(param.name, item)
+                    opened.frames[-1].symbols[param.name] = binding
+                    yield opened, binding
+
+            descend = True
+        else:
+            for name, bound in statement_bindings(node):
+                binding = SymbolBinding(name, PyStatement(bound))
+                current.frames[-1].symbols[name] = binding
+                yield current, binding
+
+        if descend and cursor.goto_first_child():
+            if opened is not None:
+                scopes.append((depth, opened))
+            depth += 1
+            continue
+
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return
+
+            depth -= 1
+            if scopes[-1][0] == depth:
+                scopes.pop()
+
+
+def extract_symbols(module: PyModule, table: SymbolTable | None = None, *, names: Collection[str] | None = None) -> SymbolTable:
+    """
+    Fill a symbol table from a module, see `iter_symbols`.
+    When `names` is given, the walk stops as soon as all of them are bound at module level,
+    later rebindings of those names are therefore not seen.
+    """
+
+    if table is None:
+        table = SymbolTable()
+
+    remaining = set(names) if names is not None else None
+    if remaining is not None and not remaining:
+        table.push_frame(SymbolTableFrame(kind="module", owner=module))
+        return table
+
+    for scope, binding in iter_symbols(module, table):
+        if remaining is not None and scope is table:
+            remaining.discard(binding.name)
+            if not remaining:
+                break
+
+    return table
@@ -3,15 +3,29 @@ from __future__ import annotations
 from collections import ChainMap
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from kanade.analyser.globals import SYMBOL_TABLE
 from kanade.analyser.utils import lazy
 
+if TYPE_CHECKING:
+    from kanade.language.python import PyItem
+
+FrameKind = Literal["module", "class", "function"]
+
+
+@dataclass
+class SymbolBinding:
+    name: str
+    item: PyItem
+    table: SymbolTable | None = None  # the scope opened by a class / function definition
+
 
 @dataclass
 class SymbolTableFrame:
     symbols: dict[str, Any] = field(default_factory=dict)  # TODO: proper type
+    kind: FrameKind = "module"
+    owner: PyItem | None = None
 
 
 @dataclass
@@ -4,11 +4,12 @@ from dataclasses import dataclass, field
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from kanade.analyser.model.type import KnType
+    from kanade.analyser.model.type import KnBaseType, KnType
+    from kanade.analyser.symbol import TypeSymbol
 
 @dataclass
 class TypeSymbolContext:
-    values: ... = field(default_factory=lambda: ...)
+    values: dict[TypeSymbol, KnBaseType] = field(default_factory=dict)  # filled by `ConstraintSolver.solve`
 
     assuming: list[tuple[KnType, Any]] = field(default_factory=list)
 
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Callable, Collection, Iterator, Mapping, TypeVar
+
+import networkx as nx
+
+from kanade.analyser.context.extract import CONTAINER_NODES
+from kanade.language.python import node_text
+
+if TYPE_CHECKING:
+    from tree_sitter import Node
+
+    from kanade.language.python import PyModule
+
+_R = TypeVar("_R")
+
+# every node that may contain an import statement, definitions included (function-level imports are dependencies too)
+IMPORT_CONTAINER_NODES = CONTAINER_NODES | {"function_definition", "class_definition"}
+
+
+def iter_imports(module: PyModule) -> Iterator[Node]:
+    cursor = module.ast_tree.walk()
+
+    while True:
+        node = cursor.node
+        assert node is not None
+
+        if node.type in {"import_statement", "import_from_statement"}:
+            yield node
+        elif node.type in IMPORT_CONTAINER_NODES and cursor.goto_first_child():
+            continue
+
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return
+
+
+def imported_names(node: Node, name: str, *, is_package: bool = False) -> Iterator[str]:
+    """
+    Yield the absolute module names an import statement may load, `name` being the importing module.
+    `from m import x` yields both `m` and `m.x`, since `x` may be a submodule.
+    """
+
+    def dotted(child: Node) -> str:
+        if child.type == "aliased_import":
+            child = child.child_by_field_name("name")  # type: ignore
+        return node_text(child)
+
+    if node.type == "import_statement":
+        for child in node.children_by_field_name("name"):
+            yield dotted(child)
+        return
+
+    module_name = node.child_by_field_name("module_name")
+    assert module_name is not None
+
+    if module_name.type == "relative_import":
+        prefix, *rest = module_name.named_children
+        package = name.split(".") if is_package else name.split(".")[:-1]
+        level = len(node_text(prefix))
+        base = package[: len(package) - level + 1]
+        target = ".".join([*base, *(node_text(rest[0]).split(".") if rest else [])])
+    else:
+        target = node_text(module_name)
+
+    yield target
+    for child in node.children_by_field_name("name"):
+        yield f"{target}.{dotted(child)}" if target else dotted(child)
+
+
+class DependencyGraph:
+    """
+    Import graph between the modules of a project, edges point from a module to the modules it imports.
+    Modules outside of the project are ignored.
+    """
+
+    graph: nx.DiGraph
+
+    def __init__(self, graph: nx.DiGraph | None = None):
+        self.graph = graph if graph is not None else nx.DiGraph()
+
+    @classmethod
+    def from_modules(cls, modules: Mapping[str, PyModule], packages: Collection[str] = ()) -> DependencyGraph:
+        graph = nx.DiGraph()
+        graph.add_nodes_from(modules)
+
+        for name, module in modules.items():
+            for statement in iter_imports(module):
+                for target in imported_names(statement, name, is_package=name in packages):
+                    # the longest prefix that is a project module, parent packages are not linked:
+                    # they would put every package in a cycle with its submodules.
+                    while target and target not in modules:
+                        target = target.rpartition(".")[0]
+
+                    if target and target != name:
+                        graph.add_edge(name, target)
+
+        return cls(graph)
+
+    def condensation(self) -> nx.DiGraph:
+        # nodes are SCC indexes, with the module names stored as the "members" attribute
+        return nx.condensation(self.graph)
+
+    def order(self) -> list[frozenset[str]]:
+        """
+        Strongly connected components, dependencies first.
+        """
+
+        condensed = self.condensation()
+        return [frozenset(condensed.nodes[ix]["members"]) for ix in reversed(list(nx.topological_sort(condensed)))]
+
+    def schedule(
+        self, analyse: Callable[[frozenset[str]], _R], *, executor: Executor | None = None, workers: int | None = None
+    ) -> dict[frozenset[str], _R]:
+        """
+        Run `analyse` once per strongly connected component, each one after all the components it imports.
+        Independent components run in parallel on `executor`. Analysis is CPU-bound Python, so the default is a process
+        pool of `workers` (`analyse` and its results must then be picklable); `kanade.analyser.shared.worker_pool`
+        gives one whose workers share a type store. A thread pool only helps when `analyse` mostly waits or
+        releases the GIL.
+        """
+
+        condensed = self.condensation()
+        members = {ix: frozenset(condensed.nodes[ix]["members"]) for ix in condensed.nodes}
+        waiting = {ix: condensed.out_degree(ix) for ix in condensed.nodes}
+        results: dict[frozenset[str], _R] = {}
+        running: dict[Future[_R], int] = {}
+
+        with nullcontext(executor) if executor is not None else ProcessPoolExecutor(workers) as pool:
+            for ix, count in waiting.items():
+                if count == 0:
+                    running[pool.submit(analyse, members[ix])] = ix
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    ix = running.pop(future)
+                    results[members[ix]] = future.result()
+
+                    for dependent in condensed.predecessors(ix):
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            running[pool.submit(analyse, members[dependent])] = dependent
+
+        return results
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Callable, Generic, Mapping, Optional, Tuple, TypeVar
+
+_R = TypeVar("_R")
+
+Fingerprint = str
+# (module, symbol) -> fingerprint of the symbol (its signature / type), None when it was missing
+SymbolKey = Tuple[str, str]
+Lookup = Callable[[str, str], Optional[Fingerprint]]
+# (module name, source, lookup) -> (result, exported symbol fingerprints)
+Analyser = Callable[[str, bytes, Lookup], Tuple[_R, Mapping[str, Fingerprint]]]
+
+
+def fingerprint(*parts: object) -> Fingerprint:
+    return blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def content_hash(source: bytes) -> bytes:
+    return blake2b(source, digest_size=16).digest()
+
+
+@dataclass
+class ModuleState(Generic[_R]):
+    content_hash: bytes
+    result: _R
+    exports: dict[str, Fingerprint]
+    depends: dict[SymbolKey, Fingerprint | None] = field(default_factory=dict)
+
+
+class IncrementalEngine(Generic[_R]):
+    """
+    Re-analyses only what an edit can affect.
+
+    The analyser reads other modules exclusively through `lookup(module, symbol)`, which records the fingerprint it saw.
+    A module is analysed again when its content hash changes, or when a symbol it looked up now has another fingerprint;
+    a re-analysed module whose exports keep their fingerprints stops the propagation there (early cutoff).
+    """
+
+    analyser: Analyser[_R]
+    states: dict[str, ModuleState[_R]]
+    sources: dict[str, bytes]
+    dependents: dict[SymbolKey, set[str]]
+
+    def __init__(self, analyser: Analyser[_R]):
+        self.analyser = analyser
+        self.states = {}
+        self.sources = {}
+        self.dependents = {}
+
+        self._pending: dict[str, None] = {}
+        self._active: set[str] = set()
+        self._analysed: list[str] = []
+
+    def __getitem__(self, name: str) -> _R:
+        return self.states[name].result
+
+    def update(self, sources: Mapping[str, bytes]) -> list[str]:
+        """
+        Bring the results up to date with `sources`, the full set of modules.
+
+        Returns:
+            list[str]: The modules that were analysed, in order.
+        """
+
+        self.sources = dict(sources)
+        self._analysed = []
+
+        removed = [(name, self.states.pop(name)) for name in list(self.states) if name not in sources]
+        for name, state in removed:
+            self._forget(name, state)
+        for name, state in removed:
+            self._invalidate(name, state.exports, {})
+
+        for name, source in sources.items():
+            state = self.states.get(name)
+            if state is None or state.content_hash != content_hash(source):
+                self._pending[name] = None
+
+        while self._pending:
+            self._analyse(next(iter(self._pending)))
+
+        return self._analysed
+
+    def _analyse(self, name: str):
+        self._pending.pop(name, None)
+        self._active.add(name)
+        depends: dict[SymbolKey, Fingerprint | None] = {}
+
+        def lookup(module: str, symbol: str) -> Fingerprint | None:
+            # analyse outdated dependencies first, unless they are already on the stack (import cycle)
+            if module in self._pending and module not in self._active:
+                self._analyse(module)
+
+            value = depends[module, symbol] = self._exported(module, symbol)
+            return value
+
+        source = self.sources[name]
+        try:
+            result, exports = self.analyser(name, source, lookup)
+        finally:
+            self._active.discard(name)
+
+        previous = self.states.get(name)
+        if previous is not None:
+            self._forget(name, previous)
+
+        state = self.states[name] = ModuleState(content_hash(source), result, dict(exports), depends)
+        for key in depends:
+            self.dependents.setdefault(key, set()).add(name)
+
+        # a dependency analysed from one of its lookups re-queued it, that is moot unless the symbols it read changed since
+        if name in self._pending and all(self._exported(*key) == value for key, value in depends.items()):
+            del self._pending[name]
+
+        self._analysed.append(name)
+        self._invalidate(name, previous.exports if previous is not None else {}, state.exports)
+
+    def _exported(self, module: str, symbol: str) -> Fingerprint | None:
+        state = self.states.get(module)
+        return state.exports.get(symbol) if state is not None else None
+
+    def _forget(self, name: str, state: ModuleState[_R]):
+        for key in state.depends:
+            users = self.dependents.get(key)
+            if users is not None:
+                users.discard(name)
+                if not users:
+                    del self.dependents[key]
+
+    def _invalidate(self, name: str, before: Mapping[str, Fingerprint], after: Mapping[str, Fingerprint]):
+        for symbol in before.keys() | after.keys():
+            value = after.get(symbol)
+            if before.get(symbol) == value:
+                continue
+
+            for user in self.dependents.get((name, symbol), ()):
+                state = self.states.get(user)
+                if state is not None and state.depends.get((name, symbol)) != value:
+                    self._pending[user] = None
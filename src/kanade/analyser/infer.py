@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import ast
+from typing import TYPE_CHECKING, Callable
+
+from kanade.analyser.model.type import (
+    ELLIPSIS,
+    NONE,
+    UNKNOWN,
+    KnBaseType,
+    KnCallable,
+    KnClassOf,
+    KnInstance,
+    KnLiteral,
+    KnOverloaded,
+    KnTuple,
+)
+from kanade.analyser.overload import OverloadResolver
+from kanade.analyser.solver import join
+from kanade.language.python import PyExp, node_text
+
+if TYPE_CHECKING:
+    from tree_sitter import Node, Tree
+
+# name -> type of the symbol, None when unknown
+Resolve = Callable[[str], "KnBaseType | None"]
+
+LITERAL_NODES = frozenset({"integer", "float", "string", "concatenated_string", "true", "false"})
+
+
+def builtin(name: str, *args: KnBaseType) -> KnInstance:
+    return KnInstance(f"builtins.{name}", list(args))
+
+
+def _literal(node: Node) -> KnBaseType:
+    try:
+        value = ast.literal_eval(node_text(node))
+    except (ValueError, SyntaxError):
+        # f-strings
+        return builtin("str")
+
+    if isinstance(value, bytes):
+        return builtin("bytes")
+    if isinstance(value, complex):
+        return builtin("complex")
+    return KnLiteral(value)
+
+
+class ExpressionInference:
+    """
+    Infers the types of the expressions of one tree.
+
+    The subtree of an expression is walked with an explicit stack, operands first; every type computed on the way is
+    kept in a table keyed by `Node.id`, so asking for the same node or any of its sub-expressions again (hover,
+    diagnostics, call checking) is a lookup and `PyExp` wrappers need not be kept. Node ids are only unique within a
+    tree: use one instance per tree (given as `tree`, it is kept alive so its ids are not reused), a new one after
+    each re-parse.
+    """
+
+    tree: Tree | None
+    resolve: Resolve
+    types: dict[int, KnBaseType]
+
+    def __init__(self, resolve: Resolve = lambda name: None, tree: Tree | None = None, overloads: OverloadResolver | None = None):
+        self.tree = tree
+        self.resolve = resolve
+        self.overloads = overloads if overloads is not None else OverloadResolver()
+        self.types = {}
+
+    def infer(self, expression: PyExp | Node) -> KnBaseType:
+        root = expression.ast_node if isinstance(expression, PyExp) else expression
+
+        cached = self.types.get(root.id)
+        if cached is not None:
+            return cached
+
+        # (node, operands already inferred)
+        stack: list[tuple[Node, bool]] = [(root, False)]
+        while stack:
+            node, ready = stack.pop()
+            if node.id in self.types:
+                continue
+
+            if ready:
+                self.types[node.id] = self._compute(node)
+                continue
+
+            stack.append((node, True))
+            stack.extend((i, False) for i in reversed(self._operands(node)) if i.id not in self.types)
+
+        return self.types[root.id]
+
+    def _operands(self, node: Node) -> list[Node]:
+        kind = node.type
+
+        if kind in {"tuple", "list", "set", "expression_list"}:
+            return [i for i in node.named_children if i.type != "comment"]
+        if kind == "dictionary":
+            return [j for i in node.named_children if i.type == "pair" for j in (i.child_by_field_name("key"), i.child_by_field_name("value"))]  # type: ignore
+        if kind in {
+            "parenthesized_expression",
+            "conditional_expression",
+            "not_operator",
+            "boolean_operator",
+            "comparison_operator",
+            "unary_operator",
+        }:
+            return [i for i in node.named_children if i.type != "comment"]
+        if kind == "call":
+            arguments = node.child_by_field_name("arguments")
+            operands = [node.child_by_field_name("function")]
+            if arguments is not None and arguments.type == "argument_list":
+                for child in arguments.named_children:
+                    if child.type == "keyword_argument":
+                        operands.append(child.child_by_field_name("value"))
+                    elif child.type not in {"list_splat", "dictionary_splat", "comment"}:
+                        operands.append(child)
+            return operands  # type: ignore
+        return []
+
+    def _compute(self, node: Node) -> KnBaseType:
+        kind = node.type
+        types = self.types
+
+        if kind in LITERAL_NODES:
+            return _literal(node)
+        if kind == "none":
+            return NONE
+        if kind == "ellipsis":
+            return ELLIPSIS
+        if kind == "identifier":
+            resolved = self.resolve(node_text(node))
+            return resolved if resolved is not None else UNKNOWN
+        if kind == "parenthesized_expression":
+            return types[node.named_children[0].id]
+        if kind in {"tuple", "expression_list"}:
+            return KnTuple([types[i.id] for i in node.named_children if i.type != "comment"])
+        if kind in {"list", "set"}:
+            elements = [types[i.id] for i in node.named_children if i.type != "comment"]
+            return builtin(kind, join(elements) if elements else UNKNOWN)
+        if kind == "dictionary":
+            pairs = [i for i in node.named_children if i.type == "pair"]
+            if not pairs:
+                return builtin("dict", UNKNOWN, UNKNOWN)
+            return builtin(
+                "dict",
+                join([types[i.child_by_field_name("key").id] for i in pairs]),  # type: ignore
+                join([types[i.child_by_field_name("value").id] for i in pairs]),  # type: ignore
+            )
+        if kind in {"not_operator", "comparison_operator"}:
+            return builtin("bool")
+        if kind == "boolean_operator":
+            return join([types[i.id] for i in node.named_children])
+        if kind == "conditional_expression":
+            body, _, alternative = node.named_children
+            return join([types[body.id], types[alternative.id]])
+        if kind == "unary_operator":
+            operand = types[node.named_children[0].id]
+            operator = node_text(node.child_by_field_name("operator"))  # type: ignore
+            if isinstance(operand, KnLiteral) and type(operand.value) in {int, float}:
+                value = operand.value
+                if operator == "-":
+                    return KnLiteral(-value)  # type: ignore
+                if operator == "+":
+                    return operand
+                if operator == "~" and isinstance(value, int):
+                    return KnLiteral(~value)
+            return UNKNOWN
+        if kind == "call":
+            return self._call(node)
+
+        return UNKNOWN
+
+    def _call(self, node: Node) -> KnBaseType:
+        callee = self.types[node.child_by_field_name("function").id]  # type: ignore
+
+        if isinstance(callee, KnClassOf):
+            return callee.type
+        if not isinstance(callee, (KnCallable, KnOverloaded)):
+            return UNKNOWN
+
+        arguments = self._arguments(node)
+        if isinstance(callee, KnOverloaded):
+            # unpacked arguments can match any overload, give up
+            matched = self.overloads.resolve(callee, *arguments) if arguments is not None else None
+            return matched.return_type if matched is not None else UNKNOWN
+
+        # generic callables: the return type with the variables solved from the arguments, as declared otherwise
+        if arguments is not None and self.overloads.shape(callee).accepts(len(arguments[0]), arguments[1].keys()):
+            bound = self.overloads.bind(callee, *arguments)
+            if bound is not None:
+                return bound.return_type
+        return callee.return_type
+
+    def _arguments(self, node: Node) -> tuple[list[KnBaseType], dict[str, KnBaseType]] | None:
+        """
+        Types of the positional and keyword arguments of a call, None when some are unpacked.
+        """
+
+        args: list[KnBaseType] = []
+        kwargs: dict[str, KnBaseType] = {}
+        arguments = node.child_by_field_name("arguments")
+        if arguments is not None and arguments.type == "argument_list":
+            for child in arguments.named_children:
+                if child.type in {"list_splat", "dictionary_splat"}:
+                    return None
+                if child.type == "keyword_argument":
+                    kwargs[node_text(child.child_by_field_name("name"))] = self.types[child.child_by_field_name("value").id]  # type: ignore
+                elif child.type != "comment":
+                    args.append(self.types[child.id])
+        return args, kwargs
@@ -0,0 +1,378 @@
+"""
+Compact binary encoding of the `Kn*` type model.
+
+Layout (little endian, all integers u32 unless noted)::
+
+    b"KNT\\x01" | strings | nodes | roots
+    string_offsets[strings + 1] | node_offsets[nodes + 1] | roots[roots] | string data | node data
+
+Every distinct string and every structurally distinct type is written once, types refer to each other and to
+strings by index. Decoding reads straight from a `memoryview` of the buffer (on little-endian hosts, big-endian ones
+unpack a copy of the tables). Laziness is per root: asking for a root decodes it together with its whole reachable
+sub-tree, as the `Kn*` dataclasses hold their children directly, while roots that are never asked for cost nothing.
+Each node is decoded at most once, so shared sub-trees stay shared after decoding, and protocols referring to
+themselves through their members keep their cycle.
+
+Not everything round-trips: `KnInstance.info` and `TypeSymbol.owner` must be `str` or None, parameter defaults only
+keep whether there is one (decoded as `PyExp(None)`) and annotations (`PyExp`) are dropped.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Any, Callable, Sequence
+
+from kanade.analyser.model.type import (
+    KnAlias,
+    KnAny,
+    KnBaseType,
+    KnCallable,
+    KnClassOf,
+    KnEllipsis,
+    KnInstance,
+    KnIntersection,
+    KnLiteral,
+    KnNever,
+    KnNone,
+    KnOverloaded,
+    KnParameters,
+    KnProtocol,
+    KnTuple,
+    KnUnbounded,
+    KnUnion,
+    KnUnknown,
+    KnUnpack,
+    KnVariable,
+)
+from kanade.analyser.signature import TypedParameter
+from kanade.analyser.symbol import TypeSymbol, TypeSymbolSpec
+from kanade.language.python import PyExp
+
+MAGIC = b"KNT\x01"
+NONE = 0xFFFFFFFF
+HEADER = struct.Struct("<4sIII")
+U32 = struct.Struct("<I")
+F64 = struct.Struct("<d")
+
+SINGLETONS: list[type[KnBaseType]] = [KnAny, KnNever, KnUnbounded, KnNone, KnEllipsis, KnUnknown]
+# kind codes
+(
+    K_SINGLETON,
+    K_ALIAS,
+    K_UNPACK,
+    K_CLASS_OF,
+    K_VARIABLE,
+    K_UNION,
+    K_INTERSECTION,
+    K_TUPLE,
+    K_INSTANCE,
+    K_PARAMETERS,
+    K_CALLABLE,
+    K_OVERLOADED,
+    K_LITERAL,
+    K_SYMBOL,
+    K_PARAMETER,
+    K_PROTOCOL,
+) = range(16)
+
+VARIANCES = ["convariant", "invariant", "contravariant"]
+PARAMETER_KINDS = ["position-only", "positional-or-keyword", "position-variables", "keyword-only", "keyword-variables"]
+LITERAL_NONE, LITERAL_FALSE, LITERAL_TRUE, LITERAL_INT, LITERAL_FLOAT, LITERAL_STR = range(6)
+
+LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def u32_array(view: memoryview) -> Sequence[int]:
+    # the format is little endian: cast in place where that is the native order, unpack a copy elsewhere
+    if LITTLE_ENDIAN:
+        return view.cast("I")
+    return array("I", struct.unpack(f"<{len(view) // 4}I", view))
+
+
+def record(kind: int, *refs: int) -> bytes:
+    return bytes((kind,)) + struct.pack(f"<{len(refs)}I", *refs)
+
+
+class TypeEncoder:
+    def __init__(self):
+        self.strings: dict[str, int] = {}
+        self.nodes: list[bytes] = []
+        self.node_index: dict[bytes, int] = {}
+        # id(object) -> (object, node index), for objects already encoded
+        self.seen: dict[int, tuple[Any, int]] = {}
+
+    def string(self, value: str | None) -> int:
+        if value is None:
+            return NONE
+        if value not in self.strings:
+            self.strings[value] = len(self.strings)
+        return self.strings[value]
+
+    def node(self, record: bytes) -> int:
+        # structurally equal types produce equal records, and are written once
+        index = self.node_index.get(record)
+        if index is None:
+            index = self.node_index[record] = len(self.nodes)
+            self.nodes.append(record)
+        return index
+
+    def refs(self, kind: int, *refs: int) -> int:
+        return self.node(record(kind, *refs))
+
+    def many(self, kind: int, prefix: Sequence[int], items: Sequence[Any], encode: Callable[[Any], int]) -> int:
+        return self.refs(kind, *prefix, len(items), *map(encode, items))
+
+    def optional(self, value: KnBaseType | None) -> int:
+        return NONE if value is None else self.encode(value)
+
+    def encode(self, value: Any) -> int:
+        cached = self.seen.get(id(value))
+        if cached is not None:
+            return cached[1]
+
+        index = self._encode(value)
+        self.seen[id(value)] = (value, index)
+        return index
+
+    def _encode(self, value: Any) -> int:
+        if isinstance(value, TypeSymbol):
+            spec = value.spec
+            if spec.default is not None or not (value.owner is None or isinstance(value.owner, str)):
+                raise TypeError(f"cannot encode type symbol {value!r}")
+            return self.refs(
+                K_SYMBOL,
+                self.string(spec.name),
+                VARIANCES.index(spec.variance),
+                self.optional(spec.bound),
+                self.string(value.owner),
+                len(spec.constraints),
+                *map(self.encode, spec.constraints),
+            )
+
+        kind = type(value)
+        if kind in SINGLETONS:
+            return self.refs(K_SINGLETON, SINGLETONS.index(kind))
+        if kind is KnAlias:
+            return self.refs(K_ALIAS, self.encode(value.alias))
+        if kind is KnUnpack:
+            return self.refs(K_UNPACK, self.encode(value.target))
+        if kind is KnClassOf:
+            return self.refs(K_CLASS_OF, self.encode(value.type))
+        if kind is KnVariable:
+            return self.refs(K_VARIABLE, self.encode(value.symbol))
+        if kind is KnUnion:
+            return self.many(K_UNION, (), value.types, self.encode)
+        if kind is KnIntersection:
+            return self.many(K_INTERSECTION, (), value.types, self.encode)
+        if kind is KnTuple:
+            return self.many(K_TUPLE, (), value.types, self.encode)
+        if kind is KnInstance:
+            if not (value.info is None or isinstance(value.info, str)):
+                raise TypeError(f"cannot encode instance info {value.info!r}")
+            return self.many(K_INSTANCE, (self.string(value.info),), value.args, self.encode)
+        if kind is KnParameters:
+            return self.many(K_PARAMETERS, (), value.parameters, self.parameter)
+        if kind is KnCallable:
+            return self.refs(K_CALLABLE, self.encode(value.parameters), self.encode(value.return_type))
+        if kind is KnOverloaded:
+            return self.many(K_OVERLOADED, (), value.overloads, self.encode)
+        if kind is KnLiteral:
+            return self.literal(value.value)
+        if kind is KnProtocol:
+            # members may refer back to the protocol, its index is reserved before they are encoded
+            index = len(self.nodes)
+            self.nodes.append(b"")
+            self.seen[id(value)] = (value, index)
+
+            members = [ref for name, type in value.members.items() for ref in (self.string(name), self.encode(type))]
+            self.nodes[index] = record(K_PROTOCOL, self.string(value.name), len(value.members), *members)
+            self.node_index.setdefault(self.nodes[index], index)
+            return index
+
+        raise TypeError(f"cannot encode {value!r}")
+
+    def parameter(self, param: TypedParameter) -> int:
+        return self.refs(
+            K_PARAMETER,
+            self.string(param.name),
+            PARAMETER_KINDS.index(param.kind),
+            self.optional(param.type),
+            param.default is not None,
+        )
+
+    def literal(self, value: Any) -> int:
+        if value is None:
+            return self.refs(K_LITERAL, LITERAL_NONE)
+        if value is True or value is False:
+            return self.refs(K_LITERAL, LITERAL_TRUE if value else LITERAL_FALSE)
+        if isinstance(value, int):
+            return self.refs(K_LITERAL, LITERAL_INT, self.string(str(value)))
+        if isinstance(value, float):
+            return self.node(bytes((K_LITERAL,)) + U32.pack(LITERAL_FLOAT) + F64.pack(value))
+        if isinstance(value, str):
+            return self.refs(K_LITERAL, LITERAL_STR, self.string(value))
+        raise TypeError(f"cannot encode literal {value!r}")
+
+    def finish(self, roots: Sequence[int]) -> bytes:
+        strings = [i.encode() for i in self.strings]
+
+        string_offsets = [0]
+        for item in strings:
+            string_offsets.append(string_offsets[-1] + len(item))
+
+        node_offsets = [0]
+        for item in self.nodes:
+            node_offsets.append(node_offsets[-1] + len(item))
+
+        return b"".join(
+            [
+                HEADER.pack(MAGIC, len(strings), len(self.nodes), len(roots)),
+                struct.pack(f"<{len(string_offsets)}I", *string_offsets),
+                struct.pack(f"<{len(node_offsets)}I", *node_offsets),
+                struct.pack(f"<{len(roots)}I", *roots),
+                *strings,
+                *self.nodes,
+            ]
+        )
+
+
+def encode(types: Sequence[KnBaseType]) -> bytes:
+    encoder = TypeEncoder()
+    return encoder.finish([encoder.encode(i) for i in types])
+
+
+class TypeStore(Sequence[KnBaseType]):
+    """
+    Decoded view over an encoded buffer; `store[i]` materialises the i-th root and everything it references on first
+    access, see the module docstring.
+    """
+
+    def __init__(self, buffer: bytes | bytearray | memoryview):
+        self.view = view = memoryview(buffer).cast("B")
+        magic, string_count, node_count, root_count = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError("not an encoded type buffer")
+
+        offset = HEADER.size
+        self.string_offsets = u32_array(view[offset : offset + 4 * (string_count + 1)])
+        offset += 4 * (string_count + 1)
+        self.node_offsets = u32_array(view[offset : offset + 4 * (node_count + 1)])
+        offset += 4 * (node_count + 1)
+        self.roots = u32_array(view[offset : offset + 4 * root_count])
+        offset += 4 * root_count
+
+        self.string_data = view[offset : offset + self.string_offsets[-1]]
+        offset += self.string_offsets[-1]
+        self.node_data = view[offset : offset + self.node_offsets[-1]]
+
+        self._strings: dict[int, str] = {}
+        self._nodes: dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.roots)
+
+    def release(self):
+        # let go of the underlying buffer (e.g. so a mmap can be closed), decoded types stay usable
+        for view in (self.string_offsets, self.node_offsets, self.roots, self.string_data, self.node_data, self.view):
+            if isinstance(view, memoryview):
+                view.release()
+
+    def __getitem__(self, index):  # type: ignore
+        if isinstance(index, slice):
+            return [self.node(i) for i in self.roots[index]]
+        return self.node(self.roots[index])
+
+    def string(self, index: int) -> str | None:
+        if index == NONE:
+            return None
+
+        value = self._strings.get(index)
+        if value is None:
+            value = self._strings[index] = str(self.string_data[self.string_offsets[index] : self.string_offsets[index + 1]], "utf-8")
+        return value
+
+    def refs(self, index: int) -> tuple[int, memoryview]:
+        record = self.node_data[self.node_offsets[index] : self.node_offsets[index + 1]]
+        return record[0], record[1:]
+
+    def optional(self, index: int) -> Any:
+        return None if index == NONE else self.node(index)
+
+    def node(self, index: int) -> Any:
+        value = self._nodes.get(index)
+        if value is None:
+            value = self._nodes[index] = self._decode(index)
+        return value
+
+    def _decode(self, index: int) -> Any:
+        kind, payload = self.refs(index)
+        if kind == K_LITERAL and U32.unpack_from(payload)[0] == LITERAL_FLOAT:
+            return KnLiteral(F64.unpack_from(payload, 4)[0])
+
+        refs = u32_array(payload)
+
+        if kind == K_SINGLETON:
+            return SINGLETONS[refs[0]]()
+        if kind == K_ALIAS:
+            return KnAlias(self.node(refs[0]))
+        if kind == K_UNPACK:
+            return KnUnpack(self.node(refs[0]))
+        if kind == K_CLASS_OF:
+            return KnClassOf(self.node(refs[0]))
+        if kind == K_VARIABLE:
+            return KnVariable(self.node(refs[0]))
+        if kind == K_UNION:
+            return KnUnion([self.node(i) for i in refs[1:]])
+        if kind == K_INTERSECTION:
+            return KnIntersection([self.node(i) for i in refs[1:]])
+        if kind == K_TUPLE:
+            return KnTuple([self.node(i) for i in refs[1:]])
+        if kind == K_INSTANCE:
+            return KnInstance(self.string(refs[0]), [self.node(i) for i in refs[2:]])
+        if kind == K_PARAMETERS:
+            return KnParameters([self.node(i) for i in refs[1:]])
+        if kind == K_PARAMETER:
+            name, parameter_kind, type_, has_default = refs
+            return TypedParameter(
+                self.string(name),  # type: ignore
+                self.optional(type_),
+                PyExp(None) if has_default else None,  # type: ignore
+                PARAMETER_KINDS[parameter_kind],  # type: ignore
+            )
+        if kind == K_CALLABLE:
+            return KnCallable(self.node(refs[0]), self.node(refs[1]))
+        if kind == K_OVERLOADED:
+            return KnOverloaded([self.node(i) for i in refs[1:]])
+        if kind == K_LITERAL:
+            tag = refs[0]
+            if tag == LITERAL_NONE:
+                return KnLiteral(None)
+            if tag in {LITERAL_FALSE, LITERAL_TRUE}:
+                return KnLiteral(tag == LITERAL_TRUE)
+            if tag == LITERAL_INT:
+                return KnLiteral(int(self.string(refs[1])))  # type: ignore
+            return KnLiteral(self.string(refs[1]))
+        if kind == K_PROTOCOL:
+            # registered before its members are decoded, for those referring back to it
+            protocol = self._nodes[index] = KnProtocol(self.string(refs[0]), {})
+            members = refs[2:]
+            for i in range(0, len(members), 2):
+                protocol.members[self.string(members[i])] = self.node(members[i + 1])  # type: ignore
+            return protocol
+        if kind == K_SYMBOL:
+            name, variance, bound, owner, count = refs[:5]
+            spec = TypeSymbolSpec(
+                self.string(name),  # type: ignore
+                VARIANCES[variance],  # type: ignore
+                self.optional(bound),
+                tuple(self.node(i) for i in refs[5 : 5 + count]),
+            )
+            return TypeSymbol(spec, self.string(owner))
+
+        raise ValueError(f"unknown node kind {kind}")
+
+
+def decode(buffer: bytes | bytearray | memoryview) -> TypeStore:
+    return TypeStore(buffer)
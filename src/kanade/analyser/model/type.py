@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from kanade.analyser.signature import TypedSignature
+from kanade.analyser.signature import TypedParameter, TypedSignature
 from kanade.analyser.symbol import TypeSymbolSpec, TypeSymbol
 from kanade.analyser.utils import Singleton
 
@@ -46,6 +46,15 @@ class KnEllipsis(KnType, metaclass=Singleton): ...
 class KnUnknown(KnType, metaclass=Singleton): ...
 
 
+# prebuilt instances, prefer these over calling the classes on hot paths
+ANY = KnAny()
+NEVER = KnNever()
+UNBOUNDED = KnUnbounded()
+NONE = KnNone()
+ELLIPSIS = KnEllipsis()
+UNKNOWN = KnUnknown()
+
+
 @dataclass
 class KnUnpack(KnType):
     target: KnBaseType
@@ -83,11 +92,15 @@ class KnClassOf(KnType):
 
 
 @dataclass
-class KnProtocol(KnType): ...
+class KnProtocol(KnType):
+    name: str | None = None
+    # member name -> expected type, see `kanade.analyser.protocol`
+    members: dict[str, KnBaseType] = field(default_factory=dict)
 
 
 @dataclass
-class KnParameters(KnType): ...
+class KnParameters(KnType):
+    parameters: list[TypedParameter] = field(default_factory=list)
 
 
 @dataclass
@@ -100,7 +113,8 @@ class KnCallable(KnFunctionLike):
     return_type: KnBaseType
 
     @property
-    def signature(self) -> TypedSignature: ...  # TODO
+    def signature(self) -> TypedSignature:
+        return TypedSignature(self.parameters.parameters, self.return_type)
 
 
 @dataclass
@@ -108,7 +122,8 @@ class KnOverloaded(KnFunctionLike):
     overloads: list[KnCallable]
 
     @property
-    def signature(self) -> ...: ...  # TODO
+    def signature(self) -> list[TypedSignature]:
+        return [overload.signature for overload in self.overloads]
 
 
 @dataclass
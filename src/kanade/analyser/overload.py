@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Collection, Mapping, Sequence
+
+from kanade.analyser.model.type import ANY, KnBaseType, KnCallable, KnOverloaded, KnUnpack
+from kanade.analyser.signature import TypedParameter
+from kanade.analyser.solver import Assignable, ConstraintSolver, Solution, structural_assignable
+from kanade.analyser.substitution import TypeSubstitutor
+
+
+@dataclass(frozen=True)
+class CallShape:
+    """
+    What a callable accepts, by count and name only; computed once per overload to reject calls cheaply.
+    """
+
+    required_positional: int  # leading parameters that must be given (positionally or, if allowed, by keyword)
+    max_positional: float  # inf with *args
+    positional_names: tuple[str, ...]  # names of positional parameters, in order
+    keyword_names: frozenset[str]  # names accepted as keywords
+    required_names: frozenset[str]  # parameters without defaults that are not position-only
+    position_only: frozenset[str]
+    variadic_keywords: bool
+
+    @classmethod
+    def of(cls, parameters: Sequence[TypedParameter]) -> CallShape:
+        positional = [i for i in parameters if i.kind in {"position-only", "positional-or-keyword"}]
+        required_positional = 0
+        for ix, param in enumerate(positional):
+            if param.default is None:
+                required_positional = ix + 1
+
+        return cls(
+            required_positional=required_positional,
+            max_positional=float("inf") if any(i.kind == "position-variables" for i in parameters) else len(positional),
+            positional_names=tuple(i.name for i in positional),
+            keyword_names=frozenset(i.name for i in parameters if i.kind in {"positional-or-keyword", "keyword-only"}),
+            required_names=frozenset(
+                i.name for i in parameters if i.default is None and i.kind in {"positional-or-keyword", "keyword-only"}
+            ),
+            position_only=frozenset(i.name for i in positional if i.kind == "position-only"),
+            variadic_keywords=any(i.kind == "keyword-variables" for i in parameters),
+        )
+
+    def accepts(self, positional: int, keywords: Collection[str]) -> bool:
+        if positional > self.max_positional:
+            return False
+
+        consumed = self.positional_names[:positional]
+        for name in keywords:
+            if name in consumed:
+                return False
+            if name not in self.keyword_names and not self.variadic_keywords:
+                return False
+
+        # required position-only parameters can only be given positionally
+        if positional < self.required_positional and any(
+            name in self.position_only for name in self.positional_names[positional : self.required_positional]
+        ):
+            return False
+
+        return all(name in keywords for name in self.required_names.difference(consumed))
+
+
+class OverloadResolver:
+    """
+    Resolves calls against `KnOverloaded`: overloads are first filtered by `CallShape`, only survivors are checked
+    for assignability (through `ConstraintSolver`, so generic overloads are inferred and come back with the solved
+    type variables substituted). Results are cached per (overloaded, argument types, keyword names) identity; types are
+    treated as immutable once seen here. Shapes and results are each kept for the `cache_size` most recently used
+    keys; call `clear` when the overload sets are rebuilt.
+    """
+
+    def __init__(self, assignable: Assignable = structural_assignable, *, cache_size: int = 4096):
+        self.assignable = assignable
+        self.substitutor = TypeSubstitutor()
+        self.cache_size = cache_size
+        # id(callable) -> (callable, shape)
+        self._shapes: dict[int, tuple[KnCallable, CallShape]] = {}
+        # (id(overloaded), *id(arg), *keyword names) -> (overloaded, args, result)
+        self._resolved: dict[tuple, tuple[KnOverloaded, tuple[KnBaseType, ...], KnCallable | None]] = {}
+
+    def clear(self):
+        self._shapes.clear()
+        self._resolved.clear()
+
+    def _lookup(self, cache: dict, key: Any) -> Any:
+        # dicts keep insertion order: a hit moves the key last, the first key is the least recently used
+        value = cache.pop(key, None)
+        if value is not None:
+            cache[key] = value
+        return value
+
+    def _store(self, cache: dict, key: Any, value: Any):
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            del cache[next(iter(cache))]
+
+    def shape(self, callable: KnCallable) -> CallShape:
+        cached = self._lookup(self._shapes, id(callable))
+        if cached is None:
+            cached = (callable, CallShape.of(callable.parameters.parameters))
+            self._store(self._shapes, id(callable), cached)
+        return cached[1]
+
+    def resolve(
+        self, overloaded: KnOverloaded, args: Sequence[KnBaseType], kwargs: Mapping[str, KnBaseType] | None = None
+    ) -> KnCallable | None:
+        """
+        Return the first overload the call matches, instantiated as by `bind`, or None.
+        """
+
+        kwargs = kwargs or {}
+        key = (id(overloaded), *map(id, args), *kwargs, *map(id, kwargs.values()))
+        cached = self._lookup(self._resolved, key)
+        if cached is not None:
+            return cached[2]
+
+        result = None
+        for candidate in overloaded.overloads:
+            if self.shape(candidate).accepts(len(args), kwargs.keys()):
+                result = self.bind(candidate, args, kwargs)
+                if result is not None:
+                    break
+
+        self._store(self._resolved, key, (overloaded, (*args, *kwargs.values()), result))
+        return result
+
+    def bind(
+        self, callable: KnCallable, args: Sequence[KnBaseType], kwargs: Mapping[str, KnBaseType] | None = None
+    ) -> KnCallable | None:
+        """
+        Check a call against `callable`, the shape of the call being already accepted. Return the callable with the
+        type variables solved from the arguments substituted (the very same object when there are none), or None
+        when the arguments are not assignable.
+        """
+
+        solution = self.solve(callable, args, kwargs or {})
+        return self.substitutor.substitute(callable, solution.values) if solution is not None else None  # type: ignore
+
+    def check(self, callable: KnCallable, args: Sequence[KnBaseType], kwargs: Mapping[str, KnBaseType]) -> bool:
+        return self.solve(callable, args, kwargs) is not None
+
+    def solve(self, callable: KnCallable, args: Sequence[KnBaseType], kwargs: Mapping[str, KnBaseType]) -> Solution | None:
+        pairs: list[tuple[KnBaseType, KnBaseType]] = []
+        parameters = callable.parameters.parameters
+        positional = [i for i in parameters if i.kind in {"position-only", "positional-or-keyword"}]
+        variadic = next((i for i in parameters if i.kind == "position-variables"), None)
+        variadic_keywords = next((i for i in parameters if i.kind == "keyword-variables"), None)
+        by_name = {i.name: i for i in parameters if i.kind in {"positional-or-keyword", "keyword-only"}}
+
+        for ix, arg in enumerate(args):
+            param = positional[ix] if ix < len(positional) else variadic
+            pairs.append((arg, _element_type(param)))  # type: ignore
+
+        for name, arg in kwargs.items():
+            param = by_name.get(name, variadic_keywords)
+            pairs.append((arg, _element_type(param)))  # type: ignore
+
+        solver = ConstraintSolver(self.assignable)
+        for arg, expected in pairs:
+            solver.constrain(arg, expected)
+
+        solution = solver.solve()
+        if solution.errors:
+            return None
+
+        if not all(self.assignable(arg, self.substitutor.substitute(expected, solution.values)) for arg, expected in pairs):
+            return None
+        return solution
+
+
+def _element_type(param: TypedParameter) -> KnBaseType:
+    if param.type is None:
+        return ANY
+    if isinstance(param.type, KnUnpack):
+        return param.type.target
+    return param.type
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping
+
+from kanade.analyser.model.type import KnAny, KnBaseType, KnInstance, KnNever, KnProtocol, KnUnion
+from kanade.analyser.solver import Assignable, ConstraintSolver, structural_assignable
+from kanade.analyser.substitution import TypeSubstitutor
+
+# member name -> type, as seen on an instance (methods bound, i.e. without `self`)
+MemberTable = Mapping[str, KnBaseType]
+
+
+class ProtocolChecker:
+    """
+    Structural conformance of classes to `KnProtocol`.
+
+    Classes are the opaque `info` of `KnInstance`; `members(info)` returns the member table of a class, inherited
+    members included, and is asked once per class. Results are cached per (class, protocol) identity, failures
+    included, so checking a pair again is a dict lookup. Call `invalidate` when the members of a class change;
+    protocols are treated as immutable, an edited protocol is expected to be a new object. A protocol met again while
+    it is being checked for the same class is assumed to hold; results that relied on such an assumption are only
+    cached once the check they assumed has succeeded.
+    """
+
+    def __init__(self, members: Callable[[Any], MemberTable], assignable: Assignable = structural_assignable):
+        self.members = members
+        self.fallback = assignable
+        self.substitutor = TypeSubstitutor()
+        # id(info) -> (info, member table)
+        self._tables: dict[int, tuple[Any, MemberTable]] = {}
+        # (id(info), id(protocol)) -> (info, protocol, result)
+        self._results: dict[tuple[int, int], tuple[Any, KnProtocol, bool]] = {}
+        # checks in progress, outermost first: key -> depth on the stack
+        self._checking: dict[tuple[int, int], int] = {}
+        # per check in progress, the lowest depth of an in-progress check its result was assumed from
+        self._assumed: list[float] = []
+        # positive results that hold only if the check at `depth` does: (depth, key, info, protocol)
+        self._provisional: list[tuple[int, tuple[int, int], Any, KnProtocol]] = []
+
+    def table(self, info: Any) -> MemberTable:
+        cached = self._tables.get(id(info))
+        if cached is None:
+            cached = self._tables[id(info)] = (info, self.members(info))
+        return cached[1]
+
+    def conforms(self, info: Any, protocol: KnProtocol) -> bool:
+        key = (id(info), id(protocol))
+        cached = self._results.get(key)
+        if cached is not None:
+            return cached[2]
+
+        depth = self._checking.get(key)
+        if depth is not None:
+            # the protocol refers to itself through a member, assume it holds while it is being checked
+            self._assumed[-1] = min(self._assumed[-1], depth)
+            return True
+
+        depth = self._checking[key] = len(self._assumed)
+        self._assumed.append(float("inf"))
+        try:
+            result = self._check(self.table(info), protocol)
+        finally:
+            del self._checking[key]
+            assumed = self._assumed.pop()
+
+        self._settle(depth, assumed, key, info, protocol, result)
+        return result
+
+    def _settle(self, depth: int, assumed: float, key: tuple[int, int], info: Any, protocol: KnProtocol, result: bool):
+        # results assumed from this check are now decided by it, or wait for the check it was itself assumed from
+        waiting = [i for i in self._provisional if i[0] == depth]
+        self._provisional = [i for i in self._provisional if i[0] != depth]
+
+        if not result:
+            # assumptions only ever make checks succeed, a failure is final; what assumed this check holds is void
+            self._results[key] = (info, protocol, False)
+            return
+
+        waiting.append((depth, key, info, protocol))
+        if assumed >= depth:
+            for _, held, held_info, held_protocol in waiting:
+                self._results[held] = (held_info, held_protocol, True)
+            return
+
+        outer = int(assumed)
+        self._assumed[-1] = min(self._assumed[-1], outer)
+        self._provisional.extend((outer, held, held_info, held_protocol) for _, held, held_info, held_protocol in waiting)
+
+    def _check(self, table: MemberTable, protocol: KnProtocol) -> bool:
+        # missing members are the common failure, rule them out before comparing any type
+        if any(name not in table for name in protocol.members):
+            return False
+
+        # generic protocols: infer their variables from the class members
+        solver = ConstraintSolver(self.assignable)
+        for name, expected in protocol.members.items():
+            solver.constrain(table[name], expected)
+
+        solution = solver.solve()
+        if solution.errors:
+            return False
+
+        return all(
+            self.assignable(table[name], self.substitutor.substitute(expected, solution.values))
+            for name, expected in protocol.members.items()
+        )
+
+    def assignable(self, source: KnBaseType, target: KnBaseType) -> bool:
+        """
+        `Assignable` aware of protocols, delegating everything else to the one given at construction.
+        """
+
+        if isinstance(source, KnUnion):
+            return all(self.assignable(i, target) for i in source.types)
+
+        if isinstance(target, KnProtocol) and not isinstance(source, (KnAny, KnNever)):
+            if isinstance(source, KnInstance):
+                return self.conforms(source.info, target)
+            if isinstance(source, KnProtocol):
+                return source is target or all(
+                    name in source.members and self.assignable(source.members[name], expected)
+                    for name, expected in target.members.items()
+                )
+
+        if isinstance(target, KnUnion) and not self.fallback(source, target):
+            return any(self.assignable(source, i) for i in target.types)
+
+        return self.fallback(source, target)
+
+    def invalidate(self, info: Any | None = None):
+        """
+        Forget the member table of `info` and every result involving it, or everything when `info` is None.
+        """
+
+        if info is None:
+            self._tables.clear()
+            self._results.clear()
+            return
+
+        self._tables.pop(id(info), None)
+        for key in [key for key in self._results if key[0] == id(info)]:
+            del self._results[key]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+_T = TypeVar("_T")
+
+# (query, arguments)
+QueryKey = tuple["Input | Query", tuple[Hashable, ...]]
+
+
+class QueryCycle(RuntimeError): ...
+
+
+@dataclass
+class Memo:
+    value: Any
+    changed_at: int  # last revision the value actually changed
+    verified_at: int  # last revision the value was known to be up to date
+    depends: list[QueryKey] | None = field(default=None)  # None for inputs
+
+
+class Input(Generic[_T]):
+    """
+    A fact set from outside, e.g. the source of a module: `source.set(db, "a", b"...")`, then `source(db, "a")`.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return f"Input({self.name!r})"
+
+    def __call__(self, db: QueryDatabase, *args: Hashable) -> _T:
+        return db.fetch((self, args))
+
+    def set(self, db: QueryDatabase, *args_and_value: Any):
+        *args, value = args_and_value
+        db.set_input((self, tuple(args)), value)
+
+
+class Query(Generic[_T]):
+    """
+    A fact derived by `fn(db, *args)` from inputs and other queries, memoized per arguments; see `QueryDatabase`.
+    """
+
+    def __init__(self, fn: Callable[..., _T]):
+        self.fn = fn
+        self.name = fn.__name__
+
+    def __repr__(self):
+        return f"Query({self.name!r})"
+
+    def __call__(self, db: QueryDatabase, *args: Hashable) -> _T:
+        return db.fetch((self, args))
+
+
+def query(fn: Callable[..., _T]) -> Query[_T]:
+    return Query(fn)
+
+
+class QueryDatabase:
+    """
+    Demand-driven, memoized analysis facts.
+
+    Every fetch made while a query runs is recorded as its dependency. Setting an input to a different value starts a
+    new revision; a memoized query is then reused if none of its dependencies changed since it was last verified,
+    dependencies being brought up to date first (red-green). A query that is re-run but yields an equal value keeps its
+    previous `changed_at`, so the queries depending on it are not re-run either (early cutoff).
+    """
+
+    revision: int
+    memos: dict[QueryKey, Memo]
+
+    def __init__(self):
+        self.revision = 0
+        self.memos = {}
+        # dependencies recorded by the running queries, innermost last
+        self._frames: list[list[QueryKey]] = []
+        self._active: set[QueryKey] = set()
+
+    def set_input(self, key: QueryKey, value: Any):
+        memo = self.memos.get(key)
+        if memo is not None and memo.value == value:
+            return
+
+        self.revision += 1
+        self.memos[key] = Memo(value, self.revision, self.revision)
+
+    def fetch(self, key: QueryKey) -> Any:
+        if self._frames:
+            self._frames[-1].append(key)
+        return self._refresh(key).value
+
+    def _refresh(self, key: QueryKey) -> Memo:
+        memo = self.memos.get(key)
+
+        if memo is not None and (memo.verified_at == self.revision or memo.depends is None):
+            return memo
+        if memo is None and isinstance(key[0], Input):
+            raise KeyError(f"{key[0].name}{key[1]!r} is not set")
+
+        if key in self._active:
+            raise QueryCycle(f"{key[0].name}{key[1]!r} depends on itself")
+
+        if memo is not None and self._unchanged(memo):
+            memo.verified_at = self.revision
+            return memo
+
+        return self._execute(key, memo)
+
+    def _unchanged(self, memo: Memo) -> bool:
+        assert memo.depends is not None
+
+        for dependency in memo.depends:
+            if self._refresh(dependency).changed_at > memo.verified_at:
+                return False
+        return True
+
+    def _execute(self, key: QueryKey, previous: Memo | None) -> Memo:
+        query, args = key
+        assert isinstance(query, Query)
+
+        self._active.add(key)
+        self._frames.append([])
+        try:
+            value = query.fn(self, *args)
+        finally:
+            depends = list(dict.fromkeys(self._frames.pop()))
+            self._active.discard(key)
+
+        changed_at = previous.changed_at if previous is not None and previous.value == value else self.revision
+        memo = self.memos[key] = Memo(value, changed_at, self.revision, depends)
+        return memo
@@ -0,0 +1,107 @@
+"""
+Read-only type store shared between analysis processes.
+
+Types known ahead of time (builtins, stdlib) are encoded once with `write_store`; every worker maps the file with
+`SharedTypeStore` instead of building its own copies, the pages being shared by the OS. Only the names a worker
+actually looks up get decoded in that worker.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Mapping
+
+from kanade.analyser.model.codec import TypeStore, encode
+from kanade.analyser.model.type import KnBaseType
+
+MAGIC = b"KNS\x01"
+HEADER = struct.Struct("<4sI")
+
+
+def write_store(path: str | os.PathLike[str], types: Mapping[str, KnBaseType]):
+    """
+    Layout: `b"KNS\\x01" | count | name_offsets[count + 1] | names | codec buffer`, the codec roots being in name order.
+    """
+
+    names = [name.encode() for name in types]
+    offsets = [0]
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+
+    # write then rename, workers never map a partial file
+    temporary = f"{os.fspath(path)}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(names)))
+        file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        file.write(b"".join(names))
+        file.write(encode(list(types.values())))
+    os.replace(temporary, path)
+
+
+class SharedTypeStore(Mapping[str, KnBaseType]):
+    def __init__(self, path: str | os.PathLike[str]):
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            self.mmap.close()
+            raise ValueError(f"{path} is not a shared type store")
+
+        offsets = struct.unpack_from(f"<{count + 1}I", self.mmap, HEADER.size)
+        start = HEADER.size + 4 * (count + 1)
+        names = self.mmap[start : start + offsets[-1]]
+        self.index = {names[offsets[i] : offsets[i + 1]].decode(): i for i in range(count)}
+        self.types = TypeStore(memoryview(self.mmap)[start + offsets[-1] :])
+
+    def __getitem__(self, name: str) -> KnBaseType:
+        return self.types[self.index[name]]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def close(self):
+        self.types.release()
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# the store of the current worker process, see `attach`
+_SHARED: SharedTypeStore | None = None
+
+
+def attach(path: str | os.PathLike[str]):
+    """
+    Map the store at `path` as this process' shared store; meant as a process pool initializer.
+    """
+
+    global _SHARED
+    _SHARED = SharedTypeStore(path)
+
+
+def shared_store() -> SharedTypeStore:
+    if _SHARED is None:
+        raise RuntimeError("no shared type store attached to this process")
+    return _SHARED
+
+
+def worker_pool(path: str | os.PathLike[str], workers: int | None = None) -> ProcessPoolExecutor:
+    """
+    A process pool whose workers all map the store at `path`, usable as `DependencyGraph.schedule(executor=...)`.
+    """
+
+    return ProcessPoolExecutor(workers, initializer=attach, initargs=(path,))
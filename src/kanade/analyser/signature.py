@@ -7,16 +7,47 @@ from typing import TYPE_CHECKING
 from kanade.language.python import PyExp
 
 if TYPE_CHECKING:
+    from tree_sitter import Node
+
     from kanade.analyser.model.type import KnBaseType
+    from kanade.signature_prototype.base import ParameterType
 
 @dataclass
 class TypedParameter:
     name: str
     type: KnBaseType | None = None
     default: PyExp | None = None
+    kind: ParameterType = "positional-or-keyword"
+    annotation: PyExp | None = None
 
 
 @dataclass
 class TypedSignature:
     parameters: list[TypedParameter]
     return_type: KnBaseType
+    return_annotation: PyExp | None = None
+
+    @classmethod
+    def from_node(cls, node: Node) -> TypedSignature:
+        # annotations are kept as expressions, types are left unresolved until analysed.
+        from kanade.analyser.model.type import UNKNOWN
+        from kanade.language.python import function_parameters
+
+        if node.type == "decorated_definition":
+            node = node.child_by_field_name("definition")  # type: ignore
+
+        return_annotation = node.child_by_field_name("return_type")
+
+        return cls(
+            [
+                TypedParameter(
+                    param.name,
+                    default=PyExp(param.default) if param.default is not None else None,
+                    kind=param.type,
+                    annotation=PyExp(param.annotation) if param.annotation is not None else None,
+                )
+                for param in function_parameters(node)
+            ],
+            UNKNOWN,
+            PyExp(return_annotation) if return_annotation is not None else None,
+        )
@@ -0,0 +1,132 @@
+"""
+Prebuilt root frames for builtins and stdlib modules.
+
+`build_snapshot` extracts the module-level symbols of parsed stubs once and writes them, with the signatures of their
+functions, to a `SharedTypeStore` file named after a version key (snapshot format, Python version and stub contents),
+so stale snapshots are never picked up. `root_table` then serves lookups from that file, decoding a symbol on its
+first access only.
+
+    python -m kanade.analyser.snapshot OUTPUT_DIRECTORY builtins=path/to/builtins.pyi ...
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from kanade.analyser.context.extract import iter_symbols
+from kanade.analyser.context.symbol_table import SymbolTable, SymbolTableFrame
+from kanade.analyser.incremental import Fingerprint, content_hash, fingerprint
+from kanade.analyser.model.type import UNKNOWN, KnBaseType, KnCallable, KnClassOf, KnInstance, KnOverloaded, KnParameters
+from kanade.analyser.shared import SharedTypeStore, write_store
+from kanade.analyser.signature import TypedSignature
+
+if TYPE_CHECKING:
+    from kanade.language.python import PyModule
+
+SNAPSHOT_FORMAT = 1
+
+
+def snapshot_version(sources: Mapping[str, bytes]) -> Fingerprint:
+    return fingerprint(SNAPSHOT_FORMAT, sys.version_info[:2], sorted((name, content_hash(i)) for name, i in sources.items()))
+
+
+def snapshot_path(directory: str | os.PathLike[str], version: Fingerprint) -> Path:
+    return Path(directory) / f"symbols-{version}.kns"
+
+
+def module_symbols(name: str, module: PyModule) -> dict[str, KnBaseType]:
+    """
+    Types of the module-level symbols: signatures for functions (`KnOverloaded` when a stub redefines one),
+    `KnClassOf` for classes and `KnUnknown` for everything else. Class members are not included.
+    """
+
+    symbols: dict[str, KnBaseType] = {}
+    table = SymbolTable()
+
+    for scope, binding in iter_symbols(module, table):
+        if scope is not table:
+            continue
+
+        node = binding.item.ast_node
+        if node.type == "function_definition":
+            signature = TypedSignature.from_node(node)
+            callable = KnCallable(KnParameters(signature.parameters), signature.return_type)
+
+            previous = symbols.get(binding.name)
+            if isinstance(previous, KnCallable):
+                callable = KnOverloaded([previous, callable])
+            elif isinstance(previous, KnOverloaded):
+                callable = KnOverloaded([*previous.overloads, callable])
+            symbols[binding.name] = callable
+        elif node.type == "class_definition":
+            symbols[binding.name] = KnClassOf(KnInstance(f"{name}.{binding.name}", []))
+        else:
+            symbols[binding.name] = UNKNOWN
+
+    return symbols
+
+
+def build_snapshot(directory: str | os.PathLike[str], modules: Mapping[str, PyModule], version: Fingerprint) -> Path:
+    """
+    Write the snapshot of `modules` for `version` (see `snapshot_version`) into `directory`, entries being keyed
+    by qualified name.
+    """
+
+    types = {f"{name}.{symbol}": type for name, module in modules.items() for symbol, type in module_symbols(name, module).items()}
+
+    path = snapshot_path(directory, version)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_store(path, types)
+    return path
+
+
+class SnapshotSymbols(dict):
+    """
+    Symbols of a module frame, fetched from the snapshot on first access.
+    Only subscription and `in` consult the snapshot, iterating yields the names loaded so far.
+    """
+
+    def __init__(self, store: SharedTypeStore, module: str):
+        super().__init__()
+        self.store = store
+        self.module = module
+
+    def __missing__(self, name: str) -> Any:
+        key = f"{self.module}.{name}"
+        if key not in self.store:
+            raise KeyError(name)
+
+        value = self[name] = self.store[key]
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return super().__contains__(name) or f"{self.module}.{name}" in self.store
+
+
+def root_table(store: SharedTypeStore, modules: Iterable[str] = ("builtins",)) -> SymbolTable:
+    """
+    A table with a frame per module of the snapshot, later modules shadowing earlier ones.
+    """
+
+    return SymbolTable(frames=[SymbolTableFrame(SnapshotSymbols(store, name), "module") for name in modules])
+
+
+def main(argv: list[str]):
+    import tree_sitter
+    import tree_sitter_python
+
+    from kanade.language.python import PyModule
+
+    directory, *specs = argv
+    parser = tree_sitter.Parser(tree_sitter.Language(tree_sitter_python.language()))
+
+    sources = {name: Path(path).read_bytes() for name, _, path in (i.partition("=") for i in specs)}
+    modules = {name: PyModule((tree := parser.parse(source)).root_node, tree) for name, source in sources.items()}
+    print(build_snapshot(directory, modules, snapshot_version(sources)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+from kanade.analyser.context.type_symbol import TypeSymbolContext
+from kanade.analyser.model.type import (
+    UNKNOWN,
+    KnAny,
+    KnBaseType,
+    KnCallable,
+    KnInstance,
+    KnIntersection,
+    KnNever,
+    KnTuple,
+    KnUnion,
+    KnVariable,
+)
+from kanade.analyser.substitution import TypeSubstitutor
+from kanade.analyser.symbol import TypeSymbol
+
+Assignable = Callable[[KnBaseType, KnBaseType], bool]
+
+
+class SolveErr: ...
+
+
+@dataclass
+class ConflictingBounds(SolveErr):
+    symbol: TypeSymbol
+    lower: KnBaseType
+    upper: KnBaseType
+
+
+@dataclass
+class UnsatisfiedBound(SolveErr):
+    symbol: TypeSymbol
+    type: KnBaseType
+    bound: KnBaseType
+
+
+@dataclass
+class UnsatisfiedConstraints(SolveErr):
+    symbol: TypeSymbol
+    type: KnBaseType
+    constraints: tuple[KnBaseType, ...]
+
+
+@dataclass
+class Solution:
+    values: dict[TypeSymbol, KnBaseType] = field(default_factory=dict)
+    errors: list[SolveErr] = field(default_factory=list)
+
+
+def structural_assignable(source: KnBaseType, target: KnBaseType) -> bool:
+    # placeholder until the model has real subtyping: Any/Never, equality and union membership only
+    if isinstance(target, KnAny) or isinstance(source, (KnAny, KnNever)) or source == target:
+        return True
+    if isinstance(source, KnUnion):
+        return all(structural_assignable(i, target) for i in source.types)
+    if isinstance(target, KnUnion):
+        return any(structural_assignable(source, i) for i in target.types)
+    return False
+
+
+def join(types: list[KnBaseType]) -> KnBaseType:
+    unique: list[KnBaseType] = []
+    for i in types:
+        for member in i.types if isinstance(i, KnUnion) else (i,):
+            if member not in unique:
+                unique.append(member)
+
+    return unique[0] if len(unique) == 1 else KnUnion(unique)
+
+
+def meet(types: list[KnBaseType]) -> KnBaseType:
+    unique: list[KnBaseType] = []
+    for i in types:
+        if i not in unique:
+            unique.append(i)
+
+    return unique[0] if len(unique) == 1 else KnIntersection(unique)
+
+
+class ConstraintSolver:
+    """
+    Collects bounds on type variables while a call is checked, then resolves them all at once.
+
+    Variables required to be equal are merged with a union-find (union by size, path compression),
+    their bounds being kept on the representative only, so each constraint costs near-constant time
+    and `solve` visits every class once.
+    """
+
+    parent: dict[TypeSymbol, TypeSymbol]
+    size: dict[TypeSymbol, int]
+    lower: dict[TypeSymbol, list[KnBaseType]]
+    upper: dict[TypeSymbol, list[KnBaseType]]
+
+    def __init__(self, assignable: Assignable = structural_assignable):
+        self.assignable = assignable
+        self.parent = {}
+        self.size = {}
+        self.lower = {}
+        self.upper = {}
+
+    def find(self, symbol: TypeSymbol) -> TypeSymbol:
+        if symbol not in self.parent:
+            self.parent[symbol] = symbol
+            self.size[symbol] = 1
+            return symbol
+
+        root = symbol
+        while self.parent[root] is not root:
+            root = self.parent[root]
+
+        while self.parent[symbol] is not root:
+            self.parent[symbol], symbol = root, self.parent[symbol]
+
+        return root
+
+    def unify(self, left: TypeSymbol, right: TypeSymbol):
+        left, right = self.find(left), self.find(right)
+        if left is right:
+            return
+
+        if self.size[left] < self.size[right]:
+            left, right = right, left
+
+        self.parent[right] = left
+        self.size[left] += self.size.pop(right)
+        self.lower.setdefault(left, []).extend(self.lower.pop(right, ()))
+        self.upper.setdefault(left, []).extend(self.upper.pop(right, ()))
+
+    def add_lower(self, symbol: TypeSymbol, type: KnBaseType):
+        self.lower.setdefault(self.find(symbol), []).append(type)
+
+    def add_upper(self, symbol: TypeSymbol, type: KnBaseType):
+        self.upper.setdefault(self.find(symbol), []).append(type)
+
+    def constrain(self, source: KnBaseType, target: KnBaseType):
+        """
+        Record that `source` must be assignable to `target`, e.g. an argument type to a parameter type.
+        """
+
+        stack = [(source, target, False)]
+        while stack:
+            source, target, invariant = stack.pop()
+
+            if isinstance(source, KnVariable) and isinstance(target, KnVariable):
+                self.unify(source.symbol, target.symbol)
+            elif isinstance(target, KnVariable):
+                self.add_lower(target.symbol, source)
+                if invariant:
+                    self.add_upper(target.symbol, source)
+            elif isinstance(source, KnVariable):
+                self.add_upper(source.symbol, target)
+                if invariant:
+                    self.add_lower(source.symbol, target)
+            elif isinstance(source, KnInstance) and isinstance(target, KnInstance):
+                # generic parameter variance is not modelled yet, arguments are treated as invariant
+                if source.info == target.info and len(source.args) == len(target.args):
+                    stack.extend((i, j, True) for i, j in zip(source.args, target.args))
+            elif isinstance(source, KnTuple) and isinstance(target, KnTuple):
+                if len(source.types) == len(target.types):
+                    stack.extend((i, j, invariant) for i, j in zip(source.types, target.types))
+            elif isinstance(source, KnCallable) and isinstance(target, KnCallable):
+                # covariant in the return type, contravariant in the parameters (matched by position)
+                stack.append((source.return_type, target.return_type, invariant))
+                stack.extend(
+                    (j.type, i.type, invariant)
+                    for i, j in zip(source.parameters.parameters, target.parameters.parameters)
+                    if i.type is not None and j.type is not None
+                )
+
+    def solve(self, context: TypeSymbolContext | None = None) -> Solution:
+        solution = Solution()
+        roots: dict[TypeSymbol, KnBaseType] = {}
+
+        for root in [symbol for symbol in self.parent if self.parent[symbol] is symbol]:
+            spec = root.spec
+            lower = self.lower.get(root, [])
+            upper = self.upper.get(root, [])
+
+            if lower:
+                value = join(lower)
+            elif upper:
+                value = meet(upper)
+            elif spec.bound is not None:
+                value = spec.bound
+            else:
+                value = UNKNOWN
+
+            for bound in upper:
+                if lower and not self.assignable(value, bound):
+                    solution.errors.append(ConflictingBounds(root, value, bound))
+
+            if spec.bound is not None and not self.assignable(value, spec.bound):
+                solution.errors.append(UnsatisfiedBound(root, value, spec.bound))
+
+            if spec.constraints:
+                for constraint in spec.constraints:
+                    if self.assignable(value, constraint):
+                        value = constraint
+                        break
+                else:
+                    solution.errors.append(UnsatisfiedConstraints(root, value, spec.constraints))
+
+            roots[root] = value
+
+        # bounds may mention other variables, one substitution pass resolves them
+        substitutor = TypeSubstitutor()
+        resolved = {root: substitutor.substitute(value, roots) for root, value in roots.items()}
+        solution.values = {symbol: resolved[self.find(symbol)] for symbol in self.parent}
+
+        if context is not None:
+            context.values.update(solution.values)
+
+        return solution
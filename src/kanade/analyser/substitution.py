@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import weakref
+from dataclasses import fields, replace
+from typing import Any, Callable, Hashable, Mapping, Sequence
+
+from kanade.analyser.model.type import (
+    KnAlias,
+    KnBaseType,
+    KnCallable,
+    KnClassOf,
+    KnInstance,
+    KnIntersection,
+    KnLiteral,
+    KnOverloaded,
+    KnParameters,
+    KnProtocol,
+    KnTuple,
+    KnType,
+    KnUnion,
+    KnUnpack,
+    KnVariable,
+)
+from kanade.analyser.signature import TypedParameter
+from kanade.analyser.symbol import TypeSymbol
+
+Substitution = Mapping[TypeSymbol, KnBaseType]
+
+EMPTY: frozenset[TypeSymbol] = frozenset()
+
+
+class TypeSubstitutor:
+    """
+    Applies `TypeSymbol -> type` maps to the `Kn*` model.
+
+    Subtrees without any of the substituted variables are returned as the very same object, and `KnInstance`
+    instantiations are shared per structurally equal (generic, args), so substituting the same arguments twice gives
+    back the same instance. Types are treated as immutable once they have been seen here.
+
+    Both caches only hold weak references: an entry goes away with its type, so a long-lived substitutor does not keep
+    every type it has seen alive.
+    """
+
+    # id(type) -> (weak reference to the type, free variables); the entry is dropped when the type dies
+    _free: dict[int, tuple[weakref.ref, frozenset[TypeSymbol]]]
+    # structural key of (info, args), see `structural_key` -> weak reference to the instance
+    _instances: dict[Hashable, weakref.ref]
+
+    def __init__(self):
+        self._free = {}
+        self._instances = {}
+
+    def instantiate(self, info: Any, args: Sequence[KnType]) -> KnInstance:
+        key = (_hashable(info), *map(structural_key, args))
+        cached = self._instances.get(key)
+        instance = cached() if cached is not None else None
+        if instance is not None:
+            return instance
+
+        instance = KnInstance(info, list(args))
+        self._instances[key] = weakref.ref(instance, _discard(self._instances, key))
+        return instance
+
+    def free_variables(self, type: KnBaseType) -> frozenset[TypeSymbol]:
+        cached = self._free.get(id(type))
+        if cached is not None:
+            return cached[1]
+
+        if isinstance(type, KnVariable):
+            result = frozenset((type.symbol,))
+        else:
+            children = _children(type)
+            result = frozenset().union(*map(self.free_variables, children)) if children else EMPTY
+
+        self._free[id(type)] = (weakref.ref(type, _discard(self._free, id(type))), result)
+        return result
+
+    def substitute(self, type: KnBaseType, mapping: Substitution) -> KnBaseType:
+        if not mapping or self.free_variables(type).isdisjoint(mapping.keys()):
+            return type
+
+        if isinstance(type, KnVariable):
+            return mapping.get(type.symbol, type)
+
+        if isinstance(type, KnInstance):
+            args = [self.substitute(arg, mapping) for arg in type.args]
+            return self.instantiate(type.info, args)  # type: ignore
+
+        if isinstance(type, (KnUnion, KnIntersection, KnTuple)):
+            return type.__class__([self.substitute(i, mapping) for i in type.types])
+
+        if isinstance(type, KnAlias):
+            return KnAlias(self.substitute(type.alias, mapping))
+
+        if isinstance(type, KnUnpack):
+            return KnUnpack(self.substitute(type.target, mapping))
+
+        if isinstance(type, KnClassOf):
+            return KnClassOf(self.substitute(type.type, mapping))
+
+        if isinstance(type, KnParameters):
+            parameters = []
+            for param in type.parameters:
+                substituted = self.substitute(param.type, mapping) if param.type is not None else None
+                parameters.append(param if substituted is param.type else replace(param, type=substituted))
+            return KnParameters(parameters)
+
+        if isinstance(type, KnCallable):
+            return KnCallable(self.substitute(type.parameters, mapping), self.substitute(type.return_type, mapping))  # type: ignore
+
+        if isinstance(type, KnOverloaded):
+            return KnOverloaded([self.substitute(i, mapping) for i in type.overloads])  # type: ignore
+
+        return type
+
+
+def _children(type: KnBaseType) -> Sequence[KnBaseType]:
+    if isinstance(type, KnInstance):
+        return type.args
+    if isinstance(type, (KnUnion, KnIntersection, KnTuple)):
+        return type.types
+    if isinstance(type, KnAlias):
+        return (type.alias,)
+    if isinstance(type, KnUnpack):
+        return (type.target,)
+    if isinstance(type, KnClassOf):
+        return (type.type,)
+    if isinstance(type, KnParameters):
+        return [i.type for i in type.parameters if i.type is not None]
+    if isinstance(type, KnCallable):
+        return (type.parameters, type.return_type)
+    if isinstance(type, KnOverloaded):
+        return type.overloads
+    return ()
+
+
+def structural_key(value: Any) -> Hashable:
+    """
+    A hashable key equal for structurally equal types. Protocols are keyed by identity, they may refer to themselves.
+    """
+
+    if isinstance(value, (list, tuple)):
+        return tuple(map(structural_key, value))
+    if isinstance(value, KnProtocol):
+        return (KnProtocol, id(value))
+    if isinstance(value, KnLiteral):
+        # `1 == True`, the literals are not the same type
+        return (KnLiteral, type(value.value), value.value)
+    if isinstance(value, KnInstance):
+        return (KnInstance, _hashable(value.info), *map(structural_key, value.args))
+    if isinstance(value, KnBaseType):
+        return (type(value), *(structural_key(getattr(value, i.name)) for i in fields(value)))
+    if isinstance(value, TypedParameter):
+        return (TypedParameter, value.name, value.kind, value.default is not None, structural_key(value.type))
+    return _hashable(value)
+
+
+def _hashable(value: Any) -> Hashable:
+    # opaque values (class infos, symbols): by value when hashable, by identity otherwise
+    try:
+        hash(value)
+    except TypeError:
+        return (id, id(value))
+    return value
+
+
+def _discard(cache: dict, key: Hashable) -> Callable[[weakref.ref], None]:
+    def callback(ref: weakref.ref):
+        entry = cache.get(key)
+        if entry is ref or (isinstance(entry, tuple) and entry[0] is ref):
+            del cache[key]
+
+    return callback
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,8 +17,9 @@ TypeVariance = Literal[
 class TypeSymbolSpec:
     name: str
     variance: TypeVariance = "invariant"
-    bound: KnBaseType | None = None
-    constraints: tuple[KnBaseType, ...] = ()
+    # `Kn*` types are not hashable, keep them out of the hash so symbols can key substitution maps
+    bound: KnBaseType | None = field(default=None, hash=False)
+    constraints: tuple[KnBaseType, ...] = field(default=(), hash=False)
     default: None = None
 
 
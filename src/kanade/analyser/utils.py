@@ -1,20 +1,31 @@
 from __future__ import annotations
-import asyncio
-from typing import Any, Callable, Generic, Self, TypeVar, Awaitable, overload
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Generic, Self, TypeVar, Awaitable, overload
 
-from awaitlet import awaitlet
+if TYPE_CHECKING:
+    import asyncio
 
 
 _T = TypeVar("_T")
 _R_co = TypeVar("_R_co", covariant=True)
 
 class Singleton(type):
-    _instances = {}
+    # the instance lives on each class itself (set for every class, so subclasses never inherit their parent's),
+    # the lock is only taken until it exists.
+    _singleton_lock = Lock()
+
+    def __init__(cls, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        cls._singleton_instance = None
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._singleton_instance
+        if instance is None:
+            with Singleton._singleton_lock:
+                instance = cls._singleton_instance
+                if instance is None:
+                    instance = cls._singleton_instance = super().__call__(*args, **kwargs)
+        return instance
 
 class future_property(Generic[_T, _R_co]):
     def __init__(self, fget: Callable[[_T], Awaitable[_R_co]]):
@@ -29,6 +40,8 @@ class future_property(Generic[_T, _R_co]):
         if instance is None:
             return self
 
+        from awaitlet import awaitlet
+
         return awaitlet(self.fget(instance))
 
 
@@ -37,6 +50,8 @@ class waitslot(Generic[_T]):
         ...
 
     def __set_name__(self, owner: type, name: str) -> None:
+        import asyncio
+
         setattr(owner, name, asyncio.Future())
         self.__name__ = name
 
@@ -49,6 +64,8 @@ class waitslot(Generic[_T]):
         if instance is None:
             return self
 
+        from awaitlet import awaitlet
+
         return awaitlet(getattr(instance, self.__name__))
 
     def __set__(self, instance: Any, value: _T) -> None:
@@ -56,6 +73,8 @@ class waitslot(Generic[_T]):
         fut.set_result(value)
     
     def __delete__(self, instance: Any) -> None:
+        import asyncio
+
         setattr(instance, self.__name__, asyncio.Future())
 
 
@@ -74,10 +93,12 @@ class lazy(Generic[_T]):
         if instance is None:
             return self
         
-        if not hasattr(instance, self.__name__):
+        # look into the instance dict directly: `hasattr` / `getattr` come back through this descriptor and recurse on
+        # first access. Once stored, the instance dict shadows this (non-data) descriptor.
+        if self.__name__ not in instance.__dict__:
             value = self.fn(instance)
-            setattr(instance, self.__name__, value)
+            instance.__dict__[self.__name__] = value
         else:
-            value = getattr(instance, self.__name__)
+            value = instance.__dict__[self.__name__]
 
         return value
\ No newline at end of file
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from tree_sitter import Tree, Node
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from tree_sitter import Tree, Node
+
+    from kanade.signature_prototype.base import ParameterType
 
 
 @dataclass
@@ -19,3 +24,62 @@ class PyStatement(PyItem):
 @dataclass
 class PyExp(PyItem):
     ...
+
+
+class PyParameter(NamedTuple):
+    name: str
+    type: ParameterType
+    annotation: Node | None
+    default: Node | None
+
+
+def node_text(node: Node) -> str:
+    return node.text.decode() if node.text is not None else ""
+
+
+def function_parameters(node: Node) -> list[PyParameter]:
+    """
+    Read the parameters of a `function_definition` (or `decorated_definition` / `lambda`) node in declaration order,
+    resolving `/` and `*` separators into parameter types. Nothing is imported or evaluated.
+    """
+
+    if node.type == "decorated_definition":
+        node = node.child_by_field_name("definition")  # type: ignore
+
+    parameters_node = node.child_by_field_name("parameters")
+    if parameters_node is None:
+        return []
+
+    result: list[PyParameter] = []
+    keyword_only = False
+
+    for child in parameters_node.named_children:
+        kind = child.type
+
+        if kind == "positional_separator":
+            result = [param._replace(type="position-only") for param in result]
+            continue
+
+        if kind == "keyword_separator":
+            keyword_only = True
+            continue
+
+        if kind == "comment":
+            continue
+
+        annotation = child.child_by_field_name("type")
+        default = child.child_by_field_name("value")
+        target = child.child_by_field_name("name") or child
+
+        if kind == "typed_parameter":
+            target = child.named_children[0]
+
+        if target.type == "list_splat_pattern":
+            keyword_only = True
+            result.append(PyParameter(node_text(target.named_children[0]), "position-variables", annotation, None))
+        elif target.type == "dictionary_splat_pattern":
+            result.append(PyParameter(node_text(target.named_children[0]), "keyword-variables", annotation, None))
+        else:
+            result.append(PyParameter(node_text(target), "keyword-only" if keyword_only else "positional-or-keyword", annotation, default))
+
+    return result
@@ -1 +1,31 @@
-from .base import Signature as Signature, Parameter as Parameter, BindResult as BindResult, BindOptions as BindOptions
+TYPE_CHECKING = False  # avoid importing `typing` just for this flag; type checkers treat it as `typing.TYPE_CHECKING`
+
+if TYPE_CHECKING:
+    from .base import Signature as Signature, Parameter as Parameter, BindResult as BindResult, BindOptions as BindOptions
+
+_EXPORTS = {
+    "Signature": ".base",
+    "Parameter": ".base",
+    "BindResult": ".base",
+    "BindOptions": ".base",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import sys
+    from importlib import import_module
+
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __dir__():
+    import sys
+
+    return sorted({*vars(sys.modules[__name__]), *_EXPORTS})
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import partial
+from inspect import CO_VARARGS, CO_VARKEYWORDS, Signature as RuntimeSignature, Parameter as RuntimeParameter, _ParameterKind
 from itertools import groupby
-from typing import Any, Literal
-from inspect import Signature as RuntimeSignature, Parameter as RuntimeParameter, _ParameterKind
+from types import FunctionType
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Sequence
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from kanade.signature_prototype.error import (
     DuplicatedParameterName,
@@ -15,10 +18,14 @@ from kanade.signature_prototype.error import (
     ParameterAlreadyAssigned,
     ParameterMisplaced,
     PositionalAssignForKeyword,
+    SignatureErr,
     SignatureErrorGroup,
     TooManyPositionalArguments,
 )
 
+if TYPE_CHECKING:
+    from tree_sitter import Node
+
 Value = Any  # TODO: Replace with a proper type
 ParameterType = Literal["position-only", "keyword-only", "position-variables", "keyword-variables", "positional-or-keyword"]
 PARAMETER_TYPES_PRIORITY = {
@@ -37,7 +44,7 @@ PARAMETER_TYPES_CAST_MAP: dict[_ParameterKind, ParameterType] = {
 }
 
 
-@dataclass(eq=True, frozen=True)  # TODO: implement ordering for get_proper_signature
+@dataclass(eq=True, frozen=True, slots=True)  # TODO: implement ordering for get_proper_signature
 class Parameter:
     """
     A parameter in a signature.
@@ -114,21 +121,21 @@ class BindOptions:
     reassignable: bool | dict[str, bool] = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BindResult:
     """
     Represents the result of binding a signature with arguments.
 
     Attributes:
         signature (Signature): The signature that was bound.
-        last_parameters (list[Parameter]): The remaining parameters after binding.
+        last_parameters (tuple[Parameter, ...]): The remaining parameters after binding, shared with the signature until consumed.
         bounded_args (dict[str, Value | list[Value] | dict[str, Value]]): The bound arguments.
         completed (bool): Indicates if the binding process is completed.
         options (BindOptions): The options for the binding process.
     """
 
     signautre: Signature
-    last_parameters: list[Parameter] = field(default_factory=list)
+    last_parameters: tuple[Parameter, ...] = ()
     bounded_args: dict[str, Value | list[Value] | dict[str, Value]] = field(default_factory=dict)
     completed: bool = False
 
@@ -149,7 +156,7 @@ class BindResult:
             SignatureErrorGroup: If there are errors in binding.
         """
         errors = []
-        next_parameters = self.last_parameters.copy()
+        next_parameters = list(self.last_parameters)
         bounded_args = self.bounded_args.copy()
 
         for ix, positional_arg in enumerate(args):
@@ -210,7 +217,7 @@ class BindResult:
         if errors:
             raise SignatureErrorGroup(errors)
 
-        return BindResult(self.signautre, next_parameters, bounded_args)
+        return BindResult(self.signautre, tuple(next_parameters), bounded_args)
 
     def apply_defaults(self):
         """
@@ -219,15 +226,19 @@ class BindResult:
         Returns:
             BindResult: The bind result.
         """
-        next_parameters = self.last_parameters.copy()
-        bounded_args = self.bounded_args.copy()
+        next_parameters = []
+        defaults = {}
+
+        for param in self.last_parameters:
+            if param.default is not None and param.name not in self.bounded_args and param.name not in defaults:
+                defaults[param.name] = param.default
+            else:
+                next_parameters.append(param)
 
-        for param in next_parameters.copy():
-            if param.default is not None and param.name not in bounded_args:
-                bounded_args[param.name] = param.default
-                next_parameters.remove(param)
+        if not defaults:
+            return BindResult(self.signautre, self.last_parameters, self.bounded_args)
 
-        return BindResult(self.signautre, next_parameters, bounded_args)
+        return BindResult(self.signautre, tuple(next_parameters), {**self.bounded_args, **defaults})
 
     def complete(self):
         """
@@ -310,15 +321,138 @@ class BindResult:
         return Signature(self.last_parameters)
 
 
+# rules: [...positional-only], /, [positional-or-keyword], [*position-variables / *], [keyword-only], [**keyword-variables]
+# last role -> parameter types that are misplaced after it
+PARAMETER_MISPLACED_AFTER: dict[ParameterType, frozenset[ParameterType]] = {
+    "position-only": frozenset(),
+    "positional-or-keyword": frozenset({"position-only"}),
+    "position-variables": frozenset({"keyword-only", "keyword-variables"}),
+    "keyword-only": frozenset({"position-only", "positional-or-keyword", "position-variables"}),
+    "keyword-variables": frozenset(PARAMETER_TYPES_PRIORITY),
+}
+
+
+def _group_by(parameters: Sequence[Parameter], key: str) -> dict[Any, list[Parameter]]:
+    groups: dict[Any, list[Parameter]] = {}
+    for param in parameters:
+        groups.setdefault(getattr(param, key), []).append(param)
+    return groups
+
+
+def _check_parameters(parameters: Sequence[Parameter]) -> list[SignatureErr]:
+    errors: list[SignatureErr] = []
+    last_role: ParameterType = "position-only"
+    misplaced = PARAMETER_MISPLACED_AFTER[last_role]
+    seen: set[str] = set()
+    positional_var_found = False
+    keyword_var_found = False
+
+    # name / type -> parameters, only built once an error needs them
+    by_name: dict[str, list[Parameter]] | None = None
+    by_type: dict[ParameterType, list[Parameter]] | None = None
+
+    for i in parameters:
+        if i.name in seen:
+            by_name = by_name or _group_by(parameters, "name")
+            errors.append(DuplicatedParameterName(i.name, by_name[i.name].copy()))
+            continue
+
+        seen.add(i.name)
+
+        if i.type == "position-variables":
+            if positional_var_found:
+                by_type = by_type or _group_by(parameters, "type")
+                errors.append(MultiplePositionalVariablesParameter(by_type["position-variables"].copy()))
+            positional_var_found = True
+
+        elif i.type == "keyword-variables":
+            if keyword_var_found:
+                by_type = by_type or _group_by(parameters, "type")
+                errors.append(MultipleKeywordVariablesParameter(by_type["keyword-variables"].copy()))
+            keyword_var_found = True
+
+        if i.type in misplaced:
+            errors.append(ParameterMisplaced(last_role, i))
+            continue
+
+        last_role = i.type
+        misplaced = PARAMETER_MISPLACED_AFTER[last_role]
+
+    return errors
+
+
+_INTERNED: WeakValueDictionary[tuple[Any, ...], Signature] = WeakValueDictionary()
+# callable -> (identity key, signature); the key is compared by identity so rebinding defaults/annotations invalidates it.
+_CALLABLE_CACHE: WeakKeyDictionary[Any, tuple[tuple[Any, ...], Signature]] = WeakKeyDictionary()
+
+
+def _typed(value: Value) -> Any:
+    # equal values of different types (`1`, `True`, `1.0`) must not share an interned signature
+    if type(value) is tuple:
+        return (tuple, *map(_typed, value))
+    return (type(value), value)
+
+
+def _intern_key(signature: Signature) -> tuple[Any, ...]:
+    return (
+        type(signature),
+        *((i.name, _typed(i.annotation), _typed(i.default), i.type) for i in signature.parameters),
+    )
+
+
+def _callable_cache_key(cls: type, func: Any) -> tuple[Any, ...] | None:
+    if type(func) is FunctionType:
+        return (
+            cls,
+            func.__code__,
+            func.__defaults__,
+            func.__kwdefaults__,
+            func.__annotations__,
+            func.__dict__.get("__wrapped__"),
+            func.__dict__.get("__signature__"),
+        )
+
+    if type(func) is partial:
+        return (cls, func.func, func.args, func.keywords)
+
+
 class Signature:
     """
     Represents a signature of a function.
     
     Attributes:
-        parameters (list[Parameter]): The parameters of the signature.
+        parameters (tuple[Parameter, ...]): The parameters of the signature.
     """
-    def __init__(self, parameters: list[Parameter]):
-        self.parameters = parameters
+
+    __slots__ = ("parameters", "__weakref__")
+
+    parameters: tuple[Parameter, ...]
+
+    def __init__(self, parameters: Sequence[Parameter]):
+        self.parameters = tuple(parameters)
+
+    def __eq__(self, other):
+        if not isinstance(other, Signature):
+            return NotImplemented
+
+        return type(self) is type(other) and self.parameters == other.parameters
+
+    def __hash__(self):
+        return hash((type(self), self.parameters))
+
+    def intern(self):
+        """
+        Return the canonical instance for signatures with the same parameters.
+        Signatures whose annotations or defaults are unhashable are returned as is.
+
+        Returns:
+            Signature: The interned signature.
+        """
+
+        try:
+            return _INTERNED.setdefault(_intern_key(self), self)
+        except TypeError:
+            return self
 
     @property
     def empty_result(self):
@@ -329,7 +463,7 @@ class Signature:
             BindResult: The bind result.
         """
 
-        return BindResult(self, self.parameters.copy())
+        return BindResult(self, self.parameters)
 
     def cbind_partial(self, args: tuple[Value, ...], kwargs: dict[str, Value]):
         """
@@ -418,47 +552,7 @@ class Signature:
             SignatureErrorGroup: If there are errors in the signature.
         """
 
-        # check if the parameters follows python rules
-        # rules: [...positional-only], /, [positional-or-keyword], [*position-variables / *], [keyword-only], [**keyword-variables]
-        errors = []
-        last_role: ParameterType = "position-only"
-        prev_args = []
-        positional_var_found = False
-        keyword_var_found = False
-
-        for i in self.parameters:
-            if i.name in prev_args:
-                errors.append(DuplicatedParameterName(i.name, [i for i in self.parameters if i.name == i.name]))
-                continue
-
-            prev_args.append(i.name)
-
-            if i.type == "position-variables" and positional_var_found:
-                errors.append(MultiplePositionalVariablesParameter([i for i in self.parameters if i.type == "position-variables"]))
-
-            if i.type == "keyword-variables" and keyword_var_found:
-                errors.append(MultipleKeywordVariablesParameter([i for i in self.parameters if i.type == "keyword-variables"]))
-
-            if last_role == "positional-or-keyword":
-                if i.type == "position-only":
-                    errors.append(ParameterMisplaced("positional-or-keyword", i))
-                    continue
-
-            elif last_role == "position-variables":
-                if i.type in {"keyword-only", "keyword-variables"}:
-                    errors.append(ParameterMisplaced("position-variables", i))
-                    continue
-
-            elif last_role == "keyword-only":
-                if i.type not in {"keyword-only", "keyword-variables"}:
-                    errors.append(ParameterMisplaced("keyword-only", i))
-                    continue
-
-            elif last_role == "keyword-variables":
-                errors.append(ParameterMisplaced("keyword-variables", i))
-                continue
-
-            last_role = i.type
+        errors = _check_parameters(self.parameters)
 
         if errors:
             group = SignatureErrorGroup(errors)
@@ -466,6 +560,20 @@ class Signature:
                 return group
             raise group
 
+    @staticmethod
+    def check_valid_many(signatures: Iterable[Signature]) -> list[SignatureErrorGroup | None]:
+        """
+        Check many signatures at once, see [`Signature.check_valid`].
+
+        Args:
+            signatures (Iterable[Signature]): The signatures to check.
+
+        Returns:
+            list[SignatureErrorGroup | None]: The errors of each signature, in order, or None for valid ones.
+        """
+
+        return [SignatureErrorGroup(errors) if (errors := _check_parameters(i.parameters)) else None for i in signatures]
+
     @classmethod
     def from_runtime(cls, signature: RuntimeSignature):
         """
@@ -487,6 +595,33 @@ class Signature:
 
         return cls(parameters)
 
+    @classmethod
+    def from_node(cls, node: Node):
+        """
+        Create a signature from a tree-sitter `function_definition` node without importing the code.
+        Annotations and defaults are kept as their source text.
+
+        Args:
+            node (tree_sitter.Node): The `function_definition`, `decorated_definition` or `lambda` node.
+
+        Returns:
+            Signature: The signature.
+        """
+
+        from kanade.language.python import function_parameters, node_text
+
+        return cls(
+            [
+                Parameter(
+                    param.name,
+                    node_text(param.annotation) if param.annotation is not None else None,
+                    node_text(param.default) if param.default is not None else None,
+                    param.type,
+                )
+                for param in function_parameters(node)
+            ]
+        )
+
     @classmethod
     def from_callable(cls, func):
         """
@@ -499,7 +634,74 @@ class Signature:
             Signature: The signature.
         """
 
-        return cls.from_runtime(RuntimeSignature.from_callable(func))
+        key = _callable_cache_key(cls, func)
+        if key is None:
+            return cls.from_runtime(RuntimeSignature.from_callable(func))
+
+        cached = _CALLABLE_CACHE.get(func)
+        if cached is not None and len(cached[0]) == len(key) and all(a is b for a, b in zip(cached[0], key)):
+            return cached[1]
+
+        if type(func) is FunctionType and key[-2] is None and key[-1] is None:
+            signature = cls.from_code(func)
+        else:
+            signature = cls.from_runtime(RuntimeSignature.from_callable(func))
+
+        _CALLABLE_CACHE[func] = (key, signature)
+        return signature
+
+    @classmethod
+    def from_code(cls, func: FunctionType):
+        """
+        Create a signature from a plain python function by reading its code object directly,
+        without going through [`inspect.Signature`]. `__wrapped__` and `__signature__` are not honoured.
+
+        Args:
+            func (FunctionType): The function.
+
+        Returns:
+            Signature: The signature, equal to `Signature.from_runtime(inspect.signature(func))`.
+        """
+
+        code = func.__code__
+        names = code.co_varnames
+        positional_count = code.co_argcount
+        positional_only_count = code.co_posonlyargcount
+        keyword_only_count = code.co_kwonlyargcount
+
+        defaults = func.__defaults__ or ()
+        keyword_defaults = func.__kwdefaults__ or {}
+        annotations = func.__annotations__
+        empty = RuntimeParameter.empty
+
+        parameters = []
+        first_default = positional_count - len(defaults)
+
+        for ix in range(positional_count):
+            name = names[ix]
+            parameters.append(
+                Parameter(
+                    name,
+                    annotations.get(name, empty),
+                    defaults[ix - first_default] if ix >= first_default else empty,
+                    "position-only" if ix < positional_only_count else "positional-or-keyword",
+                )
+            )
+
+        offset = positional_count + keyword_only_count
+        if code.co_flags & CO_VARARGS:
+            name = names[offset]
+            parameters.append(Parameter(name, annotations.get(name, empty), empty, "position-variables"))
+            offset += 1
+
+        for name in names[positional_count : positional_count + keyword_only_count]:
+            parameters.append(Parameter(name, annotations.get(name, empty), keyword_defaults.get(name, empty), "keyword-only"))
+
+        if code.co_flags & CO_VARKEYWORDS:
+            name = names[offset]
+            parameters.append(Parameter(name, annotations.get(name, empty), empty, "keyword-variables"))
+
+        return cls(parameters)
 
     def __str__(self):
         """
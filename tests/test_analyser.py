@@ -0,0 +1,674 @@
+import pytest
+
+tree_sitter = pytest.importorskip("tree_sitter")
+tree_sitter_python = pytest.importorskip("tree_sitter_python")
+
+from kanade.analyser.context.extract import extract_symbols  # noqa: E402
+from kanade.language.python import PyModule  # noqa: E402
+
+PARSER = tree_sitter.Parser(tree_sitter.Language(tree_sitter_python.language()))
+
+
+def parse(source: str) -> PyModule:
+    tree = PARSER.parse(source.encode())
+    return PyModule(tree.root_node, tree)
+
+
+SOURCE = """
+import a.b, c as d
+from e import f, g as h
+x, (y, *z) = q = 1
+
+@decorator
+class C(Base):
+    attr: int = 1
+
+    def method(self, n, *args, k=1, **kwargs):
+        local = [i for i in n]
+        return lambda t: t
+
+for key, value in items:
+    pass
+
+last = 1
+"""
+
+
+def test_extract_symbols():
+    table = extract_symbols(parse(SOURCE))
+    module = table.frames[0]
+    assert list(module.symbols) == ["a", "d", "f", "h", "x", "y", "z", "q", "C", "key", "value", "last"]
+
+    cls = module.symbols["C"].table
+    assert cls.frames[0].kind == "class" and list(cls.frames[0].symbols) == ["attr", "method"]
+
+    method = cls.frames[0].symbols["method"].table
+    assert list(method.frames[0].symbols) == ["self", "n", "args", "k", "kwargs", "local"]
+    assert table[None]["x"] is module.symbols["x"]
+
+
+def test_extract_symbols_stops_early():
+    table = extract_symbols(parse(SOURCE), names={"d", "x"})
+    assert list(table.frames[0].symbols) == ["a", "d", "f", "h", "x"]
+
+
+def test_lazy_computes_once():
+    from kanade.analyser.context.symbol_table import SymbolTable, SymbolTableFrame
+    from kanade.analyser.utils import lazy
+
+    class Counted:
+        calls = 0
+
+        @lazy
+        def value(self):
+            Counted.calls += 1
+            return object()
+
+    counted = Counted()
+    assert counted.value is counted.value and Counted.calls == 1
+
+    # `SymbolTableSlice.map` is the `lazy` the analyser relies on
+    sliced = SymbolTable([SymbolTableFrame({"a": 1}), SymbolTableFrame({"a": 2})])[None]
+    assert sliced["a"] == 2 and sliced.map is sliced.map
+
+
+def test_extract_match_captures():
+    source = """
+match subject:
+    case [aa, *bb, *_]:
+        pass
+    case {"key": cc, Color.RED: _, **dd} as ee:
+        pass
+    case Point(x=ff, y=0) | gg if ff:
+        pass
+    case Color.RED | _:
+        pass
+"""
+    table = extract_symbols(parse(source))
+    assert list(table.frames[0].symbols) == ["aa", "bb", "cc", "dd", "ee", "ff", "gg"]
+
+
+def _component_process(component: frozenset[str]) -> int:
+    import os
+
+    return os.getpid()
+
+
+def test_dependency_schedule():
+    import os
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from kanade.analyser.dependency import DependencyGraph
+
+    modules = {
+        "pkg": parse("from . import util"),
+        "pkg.util": parse("import os\nfrom pkg.core import thing"),
+        "pkg.core": parse("def f():\n    from .cycle import g"),
+        "pkg.cycle": parse("from .core import f"),
+        "pkg.leaf": parse("x = 1"),
+    }
+    graph = DependencyGraph.from_modules(modules, packages={"pkg"})
+
+    order = graph.order()
+    assert order.index(frozenset({"pkg.core", "pkg.cycle"})) < order.index(frozenset({"pkg.util"})) < order.index(frozenset({"pkg"}))
+
+    finished: list[frozenset[str]] = []
+    lock = threading.Lock()
+
+    def analyse(component: frozenset[str]):
+        with lock:
+            finished.append(component)
+        return len(component)
+
+    with ThreadPoolExecutor(4) as pool:
+        results = graph.schedule(analyse, executor=pool)
+    assert results[frozenset({"pkg.core", "pkg.cycle"})] == 2
+    assert set(results) == set(order)
+    assert finished.index(frozenset({"pkg.util"})) < finished.index(frozenset({"pkg"}))
+
+    # a process pool by default
+    pids = graph.schedule(_component_process, workers=2)
+    assert set(pids) == set(order) and os.getpid() not in pids.values()
+
+
+def test_incremental_early_cutoff():
+    from kanade.analyser.incremental import IncrementalEngine, fingerprint
+
+    # toy modules: "def <name> <signature> <body>" exports a symbol, "use <module> <name>" depends on one
+    def analyse(name: str, source: bytes, lookup):
+        exports, seen = {}, []
+        for line in source.decode().splitlines():
+            kind, *args = line.split()
+            if kind == "def":
+                exports[args[0]] = fingerprint(args[1])
+            else:
+                seen.append(lookup(*args))
+        return seen, exports
+
+    engine = IncrementalEngine(analyse)
+    sources = {
+        "app": b"use lib f\nuse util g",
+        "lib": b"def f (x) body1\ndef h (y) body",
+        "util": b"def g () body\nuse lib h",
+    }
+    assert sorted(engine.update(sources)) == ["app", "lib", "util"]
+    assert engine.update(sources) == []
+
+    # body-only edit: fingerprints unchanged, dependents untouched
+    assert engine.update({**sources, "lib": b"def f (x) body2\ndef h (y) body"}) == ["lib"]
+
+    # signature edit of `h`: only `util` uses it, and util's own exports do not change
+    sources["lib"] = b"def f (x) body2\ndef h (y,z) body"
+    assert engine.update(sources) == ["lib", "util"]
+
+    # both edited, util first: `lib` is analysed from util's lookup, util is not analysed again for the change it saw
+    sources = {"util": b"def g () body\nuse lib h\nuse lib h", "lib": b"def f (x) body2\ndef h () body", "app": sources["app"]}
+    assert engine.update(sources) == ["lib", "util"]
+    assert engine["util"] == [fingerprint("()"), fingerprint("()")]
+
+    del sources["util"]
+    assert engine.update(sources) == ["app"]
+    assert engine["app"] == [fingerprint("(x)"), None]
+
+
+def test_substitution_shares_untouched_and_instances():
+    from kanade.analyser.model.type import KnAny, KnInstance, KnLiteral, KnNone, KnTuple, KnUnion, KnVariable
+    from kanade.analyser.substitution import TypeSubstitutor
+    from kanade.analyser.symbol import TypeSymbol, TypeSymbolSpec
+
+    T, K = TypeSymbol(TypeSymbolSpec("T")), TypeSymbol(TypeSymbolSpec("K", bound=KnAny()))
+    untouched = KnInstance("dict", [KnAny(), KnNone()])
+    generic = KnTuple([KnInstance("list", [KnVariable(T)]), untouched, KnUnion([KnVariable(K), KnNone()])])
+
+    substitutor = TypeSubstitutor()
+    result = substitutor.substitute(generic, {T: KnAny(), K: KnNone()})
+
+    assert result == KnTuple([KnInstance("list", [KnAny()]), untouched, KnUnion([KnNone(), KnNone()])])
+    assert result.types[1] is untouched  # type: ignore
+    assert substitutor.substitute(generic, {}) is generic
+    assert substitutor.substitute(untouched, {T: KnNone()}) is untouched
+
+    again = substitutor.substitute(generic, {T: KnAny()})
+    assert again.types[0] is result.types[0]  # type: ignore
+
+    # instantiations are shared by structure, not by the identity of the arguments
+    assert substitutor.instantiate("list", [KnInstance("int", [])]) is substitutor.instantiate("list", [KnInstance("int", [])])
+    assert substitutor.instantiate("list", [KnLiteral(1)]) is not substitutor.instantiate("list", [KnLiteral(True)])
+
+    # the caches do not keep the types they have seen alive
+    import gc
+
+    del generic, result, again
+    gc.collect()
+    assert len(substitutor._free) == 3 and not substitutor._instances  # untouched, Any and None are still alive
+
+
+def test_constraint_solver():
+    from kanade.analyser.context.type_symbol import TypeSymbolContext
+    from kanade.analyser.model.type import KnInstance, KnLiteral, KnNone, KnUnion, KnVariable
+    from kanade.analyser.solver import ConstraintSolver, UnsatisfiedConstraints
+    from kanade.analyser.symbol import TypeSymbol, TypeSymbolSpec
+
+    T, U, V = (TypeSymbol(TypeSymbolSpec(name)) for name in "TUV")
+    S = TypeSymbol(TypeSymbolSpec("S", constraints=(KnLiteral(1), KnLiteral("a"))))
+    solver = ConstraintSolver()
+
+    # f(x: T, y: list[U], z: U) called with (1, list[V], None), V bound later
+    solver.constrain(KnLiteral(1), KnVariable(T))
+    solver.constrain(KnInstance("list", [KnVariable(V)]), KnInstance("list", [KnVariable(U)]))
+    solver.constrain(KnNone(), KnVariable(U))
+    solver.constrain(KnLiteral(2), KnVariable(V))
+    solver.constrain(KnLiteral(2.0), KnVariable(S))
+
+    context = TypeSymbolContext()
+    solution = solver.solve(context)
+
+    assert solver.find(U) is solver.find(V)
+    assert solution.values[T] == KnLiteral(1)
+    assert solution.values[U] == solution.values[V] == KnUnion([KnNone(), KnLiteral(2)])
+    assert solution.errors == [UnsatisfiedConstraints(S, KnLiteral(2.0), S.spec.constraints)]
+    assert context.values == solution.values
+
+
+def test_overload_resolution():
+    from kanade.analyser.model.type import KnCallable, KnInstance, KnLiteral, KnNone, KnOverloaded, KnParameters, KnVariable
+    from kanade.analyser.overload import OverloadResolver
+    from kanade.analyser.signature import TypedParameter
+    from kanade.analyser.symbol import TypeSymbol, TypeSymbolSpec
+    from kanade.language.python import PyExp
+
+    T = TypeSymbol(TypeSymbolSpec("T"))
+    one, none = KnLiteral(1), KnNone()
+
+    def overload(*parameters: TypedParameter, returns=none):
+        return KnCallable(KnParameters(list(parameters)), returns)
+
+    by_keyword = overload(TypedParameter("key", one, kind="keyword-only"))
+    unary = overload(TypedParameter("x", one, kind="position-only"))
+    generic = overload(
+        TypedParameter("x", KnInstance("list", [KnVariable(T)])),
+        TypedParameter("y", KnVariable(T), PyExp(None)),  # type: ignore
+        returns=KnVariable(T),
+    )
+    overloaded = KnOverloaded([by_keyword, unary, generic])
+
+    resolver = OverloadResolver()
+    assert resolver.resolve(overloaded, [one]) is unary
+    assert resolver.resolve(overloaded, [], {"key": one}) is by_keyword
+    assert resolver.resolve(overloaded, [none]) is None
+
+    items = KnInstance("list", [one])
+    instantiated = resolver.resolve(overloaded, [items, one])
+    assert instantiated is not None and instantiated.return_type == one
+    assert [i.type for i in instantiated.parameters.parameters] == [items, one]
+    assert resolver.resolve(overloaded, [items, one]) is instantiated
+    assert resolver.resolve(overloaded, [items], {"y": none}) is None
+    assert resolver.resolve(overloaded, [], {"x": one}) is None
+
+    assert resolver.shape(generic).required_names == frozenset({"x"})
+    assert resolver.resolve(overloaded, [one]) is unary
+
+    # caches are bounded, least recently used first out
+    small = OverloadResolver(cache_size=2)
+    for arg in [one, none, one, items]:
+        small.resolve(overloaded, [arg])
+    assert list(small._resolved) == [(id(overloaded), id(one)), (id(overloaded), id(items))] and len(small._shapes) == 2
+    small.clear()
+    assert not small._resolved and not small._shapes
+
+
+def test_codec_round_trip():
+    from kanade.analyser.model.codec import decode, encode
+    from kanade.analyser.model.type import (
+        KnAny,
+        KnCallable,
+        KnInstance,
+        KnLiteral,
+        KnNone,
+        KnOverloaded,
+        KnParameters,
+        KnProtocol,
+        KnTuple,
+        KnUnion,
+        KnVariable,
+    )
+    from kanade.analyser.signature import TypedParameter
+    from kanade.analyser.symbol import TypeSymbol, TypeSymbolSpec
+
+    T = TypeSymbol(TypeSymbolSpec("T", "convariant", KnInstance("int", []), (KnLiteral(1), KnLiteral("é"))), "m.f")
+    optional = KnUnion([KnInstance("str", []), KnNone()])
+    callable = KnCallable(
+        KnParameters([TypedParameter("x", KnVariable(T), kind="position-only"), TypedParameter("rest", None, kind="position-variables")]),
+        KnTuple([KnVariable(T), KnLiteral(2**80), KnLiteral(1.5), KnLiteral(True), KnLiteral(None)]),
+    )
+    types = [
+        optional,
+        KnOverloaded([callable, callable]),
+        KnUnion([KnInstance("str", []), KnNone()]),
+        KnAny(),
+        KnProtocol("Sized", {"__len__": KnCallable(KnParameters(), KnInstance("int", []))}),
+    ]
+
+    buffer = encode(types)
+    store = decode(memoryview(buffer))
+
+    assert len(store) == 5
+    assert list(store) == types
+    # structurally equal types are written once and decoded to the same object
+    assert store[0] is store[2]
+    assert store[1].overloads[0] is store[1].overloads[1]
+    assert store[3] is KnAny()
+    # protocols may refer to themselves through their members
+    linked = KnProtocol("Linked", {})
+    linked.members["next"] = KnUnion([linked, KnNone()])
+    (decoded,) = decode(encode([linked]))
+    assert decoded.name == "Linked" and decoded.members["next"].types[0] is decoded
+
+    # repeating a root only costs its index
+    single = len(encode([optional, KnOverloaded([callable])]))
+    assert len(encode([optional, *[KnOverloaded([callable])] * 10])) == single + 9 * 4
+
+
+def test_codec_decodes_lazily():
+    from kanade.analyser.model.codec import decode, encode
+    from kanade.analyser.model.type import KnInstance, KnUnion
+
+    store = decode(encode([KnInstance("a", []), KnUnion([KnInstance("b", []), KnInstance("c", [])])]))
+    assert store[0] == KnInstance("a", [])
+    assert len(store._nodes) == 1 and set(store._strings.values()) == {"a"}
+
+    with pytest.raises(ValueError):
+        decode(b"\0" * 16)
+    with pytest.raises(TypeError):
+        encode([KnInstance(object(), [])])
+
+
+def test_codec_byte_order(monkeypatch):
+    from kanade.analyser.model import codec
+    from kanade.analyser.model.type import KnInstance, KnLiteral, KnTuple
+
+    types = [KnTuple([KnInstance("a", [KnLiteral(2**40)]), KnLiteral(1.5)])]
+    buffer = codec.encode(types)
+
+    # the path big-endian hosts take
+    monkeypatch.setattr(codec, "LITTLE_ENDIAN", False)
+    store = codec.decode(buffer)
+    assert list(store) == types
+    store.release()
+
+
+def test_singleton_types():
+    from concurrent.futures import ThreadPoolExecutor
+    from dataclasses import dataclass
+
+    from kanade.analyser.model.type import ANY, NONE, UNKNOWN, KnAny, KnNone, KnType, KnUnknown
+    from kanade.analyser.utils import Singleton
+
+    assert KnAny() is ANY and KnNone() is NONE and KnUnknown() is UNKNOWN
+
+    @dataclass
+    class Special(KnType, metaclass=Singleton): ...
+
+    class Derived(Special): ...
+
+    with ThreadPoolExecutor(8) as pool:
+        instances = list(pool.map(lambda _: Special(), range(64)))
+
+    assert all(i is instances[0] for i in instances)
+    assert type(Derived()) is Derived and Derived() is Derived()
+
+
+def test_protocol_conformance():
+    from kanade.analyser.model.type import KnCallable, KnInstance, KnLiteral, KnNone, KnParameters, KnProtocol, KnUnion, KnVariable
+    from kanade.analyser.protocol import ProtocolChecker
+    from kanade.analyser.signature import TypedParameter
+    from kanade.analyser.symbol import TypeSymbol, TypeSymbolSpec
+
+    T = TypeSymbol(TypeSymbolSpec("T"))
+    integer = KnInstance("int", [])
+
+    def method(returns, *parameters):
+        return KnCallable(KnParameters([TypedParameter(f"p{ix}", i) for ix, i in enumerate(parameters)]), returns)
+
+    sized = KnProtocol("Sized", {"__len__": method(integer)})
+    iterable = KnProtocol("Iterable", {"__iter__": method(KnInstance("Iterator", [KnVariable(T)]))})
+    linked = KnProtocol("Linked", {})
+    linked.members["next"] = KnUnion([linked, KnNone()])
+    # the variable only appears in a parameter
+    supports_add = KnProtocol("SupportsAdd", {"__add__": method(KnNone(), KnVariable(T))})
+
+    classes = {
+        "list": {"__len__": method(integer), "__iter__": method(KnInstance("Iterator", [integer]))},
+        "int": {"__add__": method(KnNone(), integer)},
+        "Node": {"next": KnUnion([KnInstance("Node", []), KnNone()])},
+    }
+    asked = []
+
+    def members(info):
+        asked.append(info)
+        return classes[info]
+
+    checker = ProtocolChecker(members)
+    assert checker.conforms("list", sized) and checker.conforms("list", iterable)
+    assert not checker.conforms("int", sized)
+    assert checker.conforms("Node", linked)
+    assert not checker.conforms("int", linked)
+    assert checker.conforms("int", supports_add) and not checker.conforms("list", supports_add)
+
+    assert checker.assignable(KnInstance("list", []), KnUnion([sized, KnLiteral(1)]))
+    assert not checker.assignable(KnUnion([KnInstance("list", []), integer]), sized)
+
+    # member tables are built once per class, results (failures included) are cached
+    assert asked == ["list", "int", "Node"]
+    classes["int"]["__len__"] = method(integer)
+    assert not checker.conforms("int", sized)
+
+    checker.invalidate("int")
+    assert checker.conforms("int", sized)
+    assert asked == ["list", "int", "Node", "int"]
+
+    # mutually recursive classes: B was checked under the assumption that A conforms, which then failed
+    chain = KnProtocol("Chain", {})
+    chain.members.update(next=chain, val=integer)
+    classes.update(A={"next": KnInstance("B", []), "val": KnInstance("str", [])}, B={"next": KnInstance("A", []), "val": integer})
+    assert not checker.conforms("A", chain)
+    assert not checker.conforms("B", chain)
+    assert ProtocolChecker(members).conforms("B", chain) is False
+
+    classes.update(C={"next": KnInstance("D", []), "val": integer}, D={"next": KnInstance("C", []), "val": integer})
+    assert checker.conforms("C", chain) and checker.conforms("D", chain)
+    assert not checker._provisional and not checker._checking
+
+
+def _shared_lookup(name):
+    from kanade.analyser.shared import shared_store
+
+    return shared_store()[name]
+
+
+def test_shared_type_store(tmp_path):
+    from kanade.analyser.model.type import KnCallable, KnInstance, KnParameters, KnUnion, NONE
+    from kanade.analyser.shared import SharedTypeStore, worker_pool, write_store
+
+    optional = KnUnion([KnInstance("str", []), NONE])
+    types = {"builtins.len": KnCallable(KnParameters(), KnInstance("int", [])), "os.getenv": KnCallable(KnParameters(), optional)}
+    path = tmp_path / "builtins.kns"
+    write_store(path, types)
+
+    with SharedTypeStore(path) as store:
+        assert dict(store) == types
+        assert "os.getenv" in store and "sys.path" not in store
+
+    with worker_pool(path, 2) as pool:
+        assert list(pool.map(_shared_lookup, types)) == list(types.values())
+
+
+BUILTINS_STUB = """
+from typing import overload
+
+class int: ...
+
+@overload
+def abs(x: int, /) -> int: ...
+@overload
+def abs(x: float, /) -> float: ...
+def len(obj, /) -> int: ...
+def print(*values, sep: str = " ") -> None: ...
+
+Ellipsis = ...
+"""
+
+
+def test_builtins_snapshot(tmp_path):
+    from kanade.analyser.model.type import UNKNOWN, KnClassOf, KnInstance, KnOverloaded
+    from kanade.analyser.shared import SharedTypeStore
+    from kanade.analyser.snapshot import build_snapshot, root_table, snapshot_path, snapshot_version
+
+    sources = {"builtins": BUILTINS_STUB.encode()}
+    version = snapshot_version(sources)
+    assert version != snapshot_version({"builtins": b"def len(obj): ..."})
+
+    path = build_snapshot(tmp_path, {"builtins": parse(BUILTINS_STUB)}, version)
+    assert path == snapshot_path(tmp_path, version)
+
+    with SharedTypeStore(path) as store:
+        table = root_table(store)
+        frame = table.frames[0].symbols
+        assert not frame and "len" in frame and "open" not in frame
+
+        assert isinstance(table[None]["abs"], KnOverloaded) and len(table[None]["abs"].overloads) == 2
+        assert table[None]["int"] == KnClassOf(KnInstance("builtins.int", []))
+        assert table[None]["Ellipsis"] is UNKNOWN
+        assert [(i.name, i.kind, i.default is not None) for i in frame["print"].parameters.parameters] == [
+            ("values", "position-variables", False),
+            ("sep", "keyword-only", True),
+        ]
+        assert set(frame) == {"abs", "int", "Ellipsis", "print"}
+        with pytest.raises(KeyError):
+            table[None]["open"]
+
+
+def test_query_database():
+    from kanade.analyser.query import Input, QueryCycle, QueryDatabase, query
+
+    source = Input("source")
+    runs = []
+
+    @query
+    def module_names(db, name):
+        runs.append(("names", name))
+        table = extract_symbols(parse(source(db, name)))
+        return frozenset(table.frames[0].symbols)
+
+    @query
+    def exported(db, name):
+        runs.append(("exported", name))
+        return sorted(i for i in module_names(db, name) if not i.startswith("_"))
+
+    db = QueryDatabase()
+    source.set(db, "a", "x = 1\n_y = 2\n")
+    source.set(db, "b", "z = 3\n")
+    assert exported(db, "a") == ["x"] and exported(db, "b") == ["z"]
+    assert exported(db, "a") == ["x"]
+    assert len(runs) == 4
+
+    # unrelated input, then an edit that does not change the names: nothing / only the first level re-runs
+    runs.clear()
+    source.set(db, "b", "z = 4\n")
+    assert exported(db, "a") == ["x"] and runs == []
+    source.set(db, "a", "x = 10\n_y = 2\n")
+    assert exported(db, "a") == ["x"] and runs == [("names", "a")]
+
+    runs.clear()
+    source.set(db, "a", "x = 1\nw = 2\n")
+    assert exported(db, "a") == ["w", "x"] and runs == [("names", "a"), ("exported", "a")]
+
+    source.set(db, "a", "x = 1\nw = 2\n")
+    assert db.revision == 5
+
+    @query
+    def looping(db, n):
+        return looping(db, n)
+
+    with pytest.raises(QueryCycle):
+        looping(db, 0)
+    with pytest.raises(KeyError):
+        source(db, "missing")
+
+
+def test_artefact_cache(tmp_path):
+    from kanade.analyser.cache import ArtefactCache
+
+    computed = []
+
+    def source(module):
+        computed.append(module)
+        return module * 100
+
+    cache = ArtefactCache(budget=250, spill=tmp_path)
+    cache.register("source", source, size=len, cost=lambda value: 1.0, dump=str.encode, load=bytes.decode)
+    cache.register("tree", lambda module: parse(cache.get("source", module)), size=lambda tree: 10, cost=lambda tree: 1.0)
+
+    assert cache.get("source", "a") == "a" * 100
+    cache.get("source", "b")
+    cache.get("source", "a")
+    cache.get("source", "c")  # over budget: the least recently used one goes
+    assert set(cache.entries) == {("source", "a"), ("source", "c")}
+    assert cache.metrics.resident == 200 and cache.metrics.evictions == 1 and cache.metrics.spills == 1
+
+    assert cache.get("source", "b") == "b" * 100
+    assert computed == ["a", "b", "c"] and cache.metrics.reloads == 1
+
+    # small artefacts expensive to recompute outlive big cheap ones
+    cache.get("tree", "a")
+    cache.get("source", "d")
+    assert ("tree", "a") in cache.entries and cache.metrics.resident <= 250
+
+    cache.invalidate("b")
+    cache.get("source", "b")
+    assert computed[-1] == "b" and cache.metrics.hits == 1
+
+    # a new cache over the same directory does not see what this one spilled
+    assert cache.metrics.spills > 1 and ("source", "a") not in cache.entries
+    fresh = ArtefactCache(budget=250, spill=tmp_path)
+    fresh.register("source", lambda module: module * 50, size=len, dump=str.encode, load=bytes.decode)
+    assert fresh.get("source", "a") == "a" * 50 and fresh.metrics.reloads == 0
+
+    cache.close()
+    fresh.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_expression_inference():
+    from kanade.analyser.infer import ExpressionInference, builtin
+    from kanade.analyser.model.type import (
+        NONE,
+        UNKNOWN,
+        KnCallable,
+        KnClassOf,
+        KnLiteral,
+        KnOverloaded,
+        KnParameters,
+        KnTuple,
+        KnUnion,
+        KnVariable,
+    )
+    from kanade.analyser.signature import TypedParameter
+    from kanade.analyser.symbol import TypeSymbol, TypeSymbolSpec
+    from kanade.language.python import PyExp
+
+    integer, string = builtin("int"), builtin("str")
+    convert = KnOverloaded(
+        [
+            KnCallable(KnParameters([TypedParameter("x", KnLiteral(1))]), integer),
+            KnCallable(KnParameters([TypedParameter("x", NONE), TypedParameter("default", KnLiteral("a"), kind="keyword-only")]), string),
+        ]
+    )
+    symbols = {"convert": convert, "Path": KnClassOf(builtin("Path")), "flag": builtin("bool")}
+
+    module = parse("(convert(1), convert(None, default='a'), Path(), -2, [1, 'a' if flag else None], {}, not x, f'{x}', y)\n")
+    expression = module.ast_tree.root_node.named_children[0].named_children[0]
+    asked = []
+
+    def resolve(name):
+        asked.append(name)
+        return symbols.get(name)
+
+    inference = ExpressionInference(resolve, module.ast_tree)
+    result = inference.infer(PyExp(expression))
+    assert result == KnTuple(
+        [
+            integer,
+            string,
+            builtin("Path"),
+            KnLiteral(-2),
+            builtin("list", KnUnion([KnLiteral(1), KnLiteral("a"), NONE])),
+            builtin("dict", UNKNOWN, UNKNOWN),
+            builtin("bool"),
+            string,
+            UNKNOWN,
+        ]
+    )
+
+    # every sub-expression was inferred on the way and is served from the table, by node
+    inner = expression.named_children[0]
+    assert inference.infer(inner) is inference.types[inner.id] == integer
+    assert inference.infer(expression) is result
+    assert sorted(asked) == ["Path", "convert", "convert", "flag", "x", "y"]
+
+    # generic callees: the return type is solved from the arguments, left as declared when the call does not fit
+    T = TypeSymbol(TypeSymbolSpec("T"))
+    symbols["first"] = KnCallable(KnParameters([TypedParameter("x", KnVariable(T))]), KnVariable(T))
+    symbols["pick"] = KnOverloaded(
+        [
+            KnCallable(KnParameters([TypedParameter("x", NONE)]), NONE),
+            KnCallable(KnParameters([TypedParameter("x", builtin("list", KnVariable(T)))]), KnVariable(T)),
+        ]
+    )
+    module = parse("(first(1), first(), pick([flag]))\n")
+    generic = ExpressionInference(symbols.get, module.ast_tree).infer(module.ast_tree.root_node.named_children[0].named_children[0])
+    assert generic == KnTuple([KnLiteral(1), KnVariable(T), builtin("bool")])
+
+    deep = parse("[" * 2000 + "]" * 2000 + "\n").ast_tree.root_node.named_children[0].named_children[0]
+    assert ExpressionInference().infer(deep).info == "builtins.list"
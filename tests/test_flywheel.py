@@ -0,0 +1,213 @@
+import pytest
+
+from flywheel import CollectContext, FnCollectEndpoint, FnImplementEntity, FnOverload, InstanceContext, SimpleOverload, scoped_collect
+
+NAME = SimpleOverload("name")
+LANG = SimpleOverload("lang")
+
+
+@FnCollectEndpoint
+def greet(name: str):
+    yield NAME.hold(name)
+    return lambda: None
+
+
+@FnCollectEndpoint
+def localized(name: str, lang: str):
+    yield NAME.hold(name)
+    yield LANG.hold(lang)
+    return lambda: None
+
+
+@pytest.fixture
+def context():
+    ctx = CollectContext()
+    with ctx.lookup_scope():
+        yield ctx
+
+
+def test_latest_registration_first(context):
+    a1 = context.collect(greet("a")(lambda: 1))
+    a2 = context.collect(greet("a")(lambda: 2))
+
+    harvest = greet.get_control().inter(NAME, "a")
+    assert list(harvest) == [a2.impl, a1.impl]
+    assert harvest.first is a2.impl
+
+
+def test_priority_order(context):
+    high = context.collect(greet("a")(FnImplementEntity(lambda: "high", priority=10)))
+    low = context.collect(greet("a")(FnImplementEntity(lambda: "low", priority=-1)))
+    plain = context.collect(greet("a")(lambda: "plain"))
+
+    harvest = greet.get_control().inter(NAME, "a")
+    assert list(harvest) == [high.impl, plain.impl, low.impl]
+    assert harvest.first is high.impl
+
+
+def test_union_keeps_priority_order(context):
+    a = context.collect(greet("a")(FnImplementEntity(lambda: "a", priority=1)))
+    b = context.collect(greet("b")(lambda: "b"))
+    c = context.collect(greet("b")(FnImplementEntity(lambda: "c", priority=2)))
+
+    harvest = greet.get_control().inter(NAME, "a").union(NAME, "b")
+    assert list(harvest) == [c.impl, a.impl, b.impl]
+    assert list(greet.get_control().inter(NAME, "a")) == [a.impl]
+
+
+def test_inter_probes_smallest(context):
+    wide = [context.collect(localized("a", str(i))(lambda: None)) for i in range(50)]
+    target = context.collect(localized("a", "en")(lambda: "en"))
+    context.collect(localized("b", "en")(lambda: "other"))
+
+    harvest = localized.get_control().inter(NAME, "a").inter(LANG, "en")
+    assert harvest.first is target.impl
+    assert list(harvest) == [target.impl]
+    assert harvest.result == {target.impl: 0}
+    assert wide[0].impl in localized.get_control().inter(NAME, "a").result  # type: ignore
+
+    assert not localized.get_control().inter(NAME, "b").inter(LANG, "0")
+
+
+def test_discard_prunes_layout(context):
+    keep = context.collect(localized("a", "en")(lambda: "keep"))
+    drop = context.collect(localized("a", "jp")(lambda: "drop"))
+    generation = context.generation
+
+    context.discard(drop)
+    assert context.generation > generation
+    assert list(localized.get_control().inter(NAME, "a")) == [keep.impl]
+    assert "jp" not in localized.get_control().record.scopes["lang"]
+
+    keep.uncollect()
+    assert localized.signature not in context.fn_implements
+    assert keep.collect_context is None
+
+
+def test_gather_and_race(context):
+    import asyncio
+
+    async def main():
+        # each handler waits for the other: run one after another, they would never finish
+        ping, pong = asyncio.Event(), asyncio.Event()
+
+        async def left():
+            ping.set()
+            await pong.wait()
+            return "left"
+
+        async def right():
+            pong.set()
+            await ping.wait()
+            return "right"
+
+        async def fast():
+            return "fast"
+
+        context.collect(greet("a")(left))
+        context.collect(greet("a")(right))
+        context.collect(greet("b")(lambda: None))
+        context.collect(greet("b")(fast))
+
+        harvest = greet.get_control().inter(NAME, "a")
+        assert await asyncio.wait_for(harvest.gather(), 1) == ["right", "left"]
+
+        ping.clear()
+        pong.clear()
+        with pytest.raises(asyncio.TimeoutError):
+            await harvest.gather(limit=1, timeout=0.05)
+
+        others = greet.get_control().inter(NAME, "b")
+        assert await others.gather(limit=1) == ["fast", None]
+        assert await others.race() == "fast"
+
+    asyncio.run(main())
+
+
+def test_lazy_collect():
+    ctx = CollectContext(lazy=True)
+    laid = []
+
+    @FnCollectEndpoint
+    def tracked(name: str):
+        laid.append(name)
+        yield NAME.hold(name)
+        return lambda: None
+
+    with ctx.lookup_scope():
+        a = ctx.collect(tracked("a")(lambda: "a"))
+        b = ctx.collect(tracked("b")(lambda: "b"))
+        ctx.discard(b)
+        assert laid == [] and tracked.signature in ctx.pending
+
+        assert tracked.get_control().inter(NAME, "a").first is a.impl
+        assert laid == ["a"] and not ctx.pending
+
+
+def test_scoped_collect_binds_per_instance_context(context):
+    collector = scoped_collect()
+    collector.fn_implements = context.fn_implements
+    assert collector.target is collector.target
+
+    class Handler(collector.target):
+        @collector.target.impl(greet("a"))
+        def hello(self):
+            return self
+
+    implement = greet.get_control().inter(NAME, "a").first
+    first, second = Handler(), Handler()
+
+    with InstanceContext().scope(inherit=False) as outer:
+        outer.store(first)
+        assert implement() is first
+
+        with InstanceContext().scope() as inner:
+            assert implement() is first
+            inner.store(second)
+            assert implement() is second
+
+        assert implement() is first
+
+
+def test_discard_without_prune(context):
+    class Legacy(SimpleOverload):
+        prune = FnOverload.prune  # a third-party overload written before the hook existed
+
+    KEY = Legacy("key")
+
+    @FnCollectEndpoint
+    def keyed(key: str):
+        yield KEY.hold(key)
+        return lambda: None
+
+    entity = context.collect(keyed("a")(lambda: "a"))
+    context.discard(entity)
+    assert not keyed.get_control().inter(KEY, "a")
+    assert keyed.get_control().record.scopes["key"] == {"a": {}}
+
+
+def test_scoped_collect_follows_instance_writes(context):
+    collector = scoped_collect()
+    collector.fn_implements = context.fn_implements
+
+    class Handler(collector.target):
+        @collector.target.impl(greet("b"))
+        def hello(self):
+            return self
+
+    implement = greet.get_control().inter(NAME, "b").first
+    first, second, third = Handler(), Handler(), Handler()
+
+    base = InstanceContext()
+    with base.scope(inherit=False):
+        base.instances[Handler] = first
+        assert implement() is first
+        base.instances[Handler] = second
+        assert implement() is second
+
+        with InstanceContext().scope():
+            assert implement() is second
+            with InstanceContext().scope():
+                base.store(third)
+                assert implement() is third
+            assert implement() is third
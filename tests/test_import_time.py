@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def imported_modules(statement: str) -> set[str]:
+    """
+    Modules a fresh interpreter has loaded after running `statement`, beyond those of its startup.
+    Timings are left to `benchmarks/import_time.py`, they are too noisy to assert on.
+    """
+
+    def run(code: str) -> set[str]:
+        proc = subprocess.run(
+            [sys.executable, "-c", f"import sys; {code}; print(*sys.modules)"],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            check=True,
+        )
+        return set(proc.stdout.split())
+
+    return run(statement) - run("pass")
+
+
+@pytest.mark.parametrize("package", ["flywheel", "flywheel.fn", "kanade.signature_prototype"])
+def test_lazy_packages(package):
+    modules = imported_modules(f"import {package}")
+
+    assert not modules & {"typing", "inspect", "dataclasses", "asyncio"}
+    # no submodule runs until a name is used, the shared `__getattr__` helper aside
+    assert not {i for i in modules if i.startswith(f"{package}.")} - {"flywheel._lazy"}
+
+
+@pytest.mark.parametrize("module", ["kanade.analyser.utils", "kanade.language.python"])
+def test_no_heavy_imports(module):
+    modules = imported_modules(f"import {module}")
+
+    assert not modules & {"asyncio", "awaitlet", "tree_sitter"}
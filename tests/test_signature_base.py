@@ -46,3 +46,80 @@ def test_options(signature):
 
 def test_check_valid(signature):
     assert signature.check_valid() is None
+
+def test_slots_and_intern(signature):
+    assert not hasattr(signature.parameters[0], "__dict__")
+    assert not hasattr(signature, "__dict__")
+    assert signature.empty_result.last_parameters is signature.parameters
+
+    same = Signature(list(signature.parameters))
+    assert same == signature and same is not signature
+    assert same.intern() is signature.intern()
+    assert Signature([Parameter(name="x", default=[])]).intern() is not None
+
+def test_intern_keeps_value_types():
+    one = Signature([Parameter(name="x", default=1)]).intern()
+    true = Signature([Parameter(name="x", default=True)]).intern()
+    assert true is not one and true.parameters[0].default is True
+
+    zero = Signature([Parameter(name="x", default=(0,), annotation=0)]).intern()
+    false = Signature([Parameter(name="x", default=(False,), annotation=0.0)]).intern()
+    assert false is not zero and false.parameters[0].default == (False,) and type(false.parameters[0].annotation) is float
+
+def test_from_code_matches_runtime():
+    import inspect
+
+    def full(a, b: int, /, c=1, *args: str, d, e: "x" = 2, **kwargs: float) -> None: ...
+
+    def keyword_only(*, a=1, b): ...
+
+    for func in (full, keyword_only, lambda: None, lambda x, y=2: None):
+        assert Signature.from_code(func) == Signature.from_runtime(inspect.signature(func))
+
+def test_from_callable_cache():
+    def func(a, b=1): ...
+
+    signature = Signature.from_callable(func)
+    assert Signature.from_callable(func) is signature
+
+    func.__defaults__ = (2,)
+    assert Signature.from_callable(func) is not signature
+    assert Signature.from_callable(func).parameters[1].default == 2
+
+def test_check_valid_errors():
+    from kanade.signature_prototype.error import DuplicatedParameterName, MultiplePositionalVariablesParameter, ParameterMisplaced
+
+    a, b = Parameter(name="a"), Parameter(name="a", type="keyword-only")
+    first, second = Parameter(name="args", type="position-variables"), Parameter(name="more", type="position-variables")
+    late = Parameter(name="late", type="position-only")
+
+    group = Signature([a, late, first, second, b]).check_valid(return_errors=True)
+    assert group is not None
+    assert group.errors == [
+        ParameterMisplaced("positional-or-keyword", late),
+        MultiplePositionalVariablesParameter([first, second]),
+        DuplicatedParameterName("a", [a, b]),
+    ]
+
+    assert Signature.check_valid_many([Signature([a]), Signature([a, b])]) == [
+        None,
+        Signature([a, b]).check_valid(return_errors=True),
+    ]
+
+def test_from_node():
+    tree_sitter = pytest.importorskip("tree_sitter")
+    tree_sitter_python = pytest.importorskip("tree_sitter_python")
+
+    parser = tree_sitter.Parser(tree_sitter.Language(tree_sitter_python.language()))
+    tree = parser.parse(b'def f(a, b: int, /, c=1, *args: str, d, e: "x" = 2, **kwargs: float) -> None: ...')
+
+    signature = Signature.from_node(tree.root_node.named_children[0])
+    assert signature.parameters == (
+        Parameter("a", type="position-only"),
+        Parameter("b", "int", type="position-only"),
+        Parameter("c", default="1"),
+        Parameter("args", "str", type="position-variables"),
+        Parameter("d", type="keyword-only"),
+        Parameter("e", '"x"', "2", type="keyword-only"),
+        Parameter("kwargs", "float", type="keyword-variables"),
+    )